@@ -3,19 +3,64 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.event import async_track_state_change_event
-
-from .const import CONF_POLL_INTERVAL, CONF_SOURCE_ENTITY, DEFAULT_POLL_INTERVAL, DOMAIN
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
+
+from .artwork import ArtworkCache, async_get_artwork_cache
+from .const import (
+    ACTIVE_PLAYBACK_STATES,
+    BREAKER_RESET_STATES,
+    CONF_ADAPTIVE_POLLING,
+    CONF_ARTWORK_CACHE_SIZE,
+    CONF_ARTWORK_VARIANTS,
+    CONF_ARTWORK_WEBP,
+    CONF_HUB_MODE,
+    CONF_POLL_CEILING,
+    CONF_POLL_FLOOR,
+    CONF_POLL_INTERVAL,
+    CONF_PUSH_UPDATES,
+    CONF_SOURCE_ENTITY,
+    CONF_STATE_DEBOUNCE,
+    CONF_STREAM_ATTRIBUTE_LIMIT,
+    CONF_TRANSPORT,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_ARTWORK_CACHE_SIZE,
+    DEFAULT_ARTWORK_VARIANTS,
+    DEFAULT_ARTWORK_WEBP,
+    DEFAULT_HUB_MODE,
+    DEFAULT_POLL_CEILING,
+    DEFAULT_POLL_FLOOR,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_PUSH_UPDATES,
+    DEFAULT_STATE_DEBOUNCE,
+    DEFAULT_STREAM_ATTRIBUTE_LIMIT,
+    DEFAULT_TRANSPORT,
+    DOMAIN,
+    SNAPSHOT_STORAGE_VERSION,
+)
 from .coordinator import KodiStreamDetailsCoordinator
+from .hub import async_get_hub
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Kodi Stream Details services."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Kodi Stream Details from a config entry."""
@@ -32,16 +77,51 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Get poll interval from options, fall back to default
     poll_interval = entry.options.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL)
+    push_updates = entry.options.get(CONF_PUSH_UPDATES, DEFAULT_PUSH_UPDATES)
+    adaptive_polling = entry.options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING)
+    poll_floor = entry.options.get(CONF_POLL_FLOOR, DEFAULT_POLL_FLOOR)
+    poll_ceiling = entry.options.get(CONF_POLL_CEILING, DEFAULT_POLL_CEILING)
+    artwork_variants = entry.options.get(CONF_ARTWORK_VARIANTS, DEFAULT_ARTWORK_VARIANTS)
+    artwork_webp = entry.options.get(CONF_ARTWORK_WEBP, DEFAULT_ARTWORK_WEBP)
+    state_debounce = entry.options.get(CONF_STATE_DEBOUNCE, DEFAULT_STATE_DEBOUNCE)
+    transport = entry.options.get(CONF_TRANSPORT, DEFAULT_TRANSPORT)
+    stream_attribute_limit = entry.options.get(
+        CONF_STREAM_ATTRIBUTE_LIMIT, DEFAULT_STREAM_ATTRIBUTE_LIMIT
+    )
+
+    # Artwork is cached in a store shared by all players
+    artwork_cache = await async_get_artwork_cache(hass)
+    await _async_set_artwork_budget(entry, artwork_cache, source_entity_id)
 
     # Create the coordinator
     coordinator = KodiStreamDetailsCoordinator(
         hass=hass,
         source_entity_id=source_entity_id,
+        artwork_cache=artwork_cache,
         poll_interval=poll_interval,
+        push_updates=push_updates,
+        adaptive_polling=adaptive_polling,
+        poll_floor=poll_floor,
+        poll_ceiling=poll_ceiling,
+        artwork_variants=tuple(artwork_variants),
+        artwork_webp=artwork_webp,
+        state_debounce=state_debounce,
+        transport=transport,
+        stream_attribute_limit=stream_attribute_limit,
+        snapshot_store=_snapshot_store(hass, entry),
     )
 
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    # Restore the last snapshot instead of waiting for Kodi, and fetch live
+    # data in the background
+    await coordinator.async_restore_snapshot()
+    entry.async_create_background_task(
+        hass,
+        coordinator.async_refresh(),
+        f"{DOMAIN} first refresh {source_entity_id}",
+    )
+
+    # In hub mode one shared scheduler polls all players
+    _async_set_hub_mode(hass, entry, coordinator)
 
     # Store coordinator
     hass.data.setdefault(DOMAIN, {})
@@ -61,15 +141,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             if old_state is None or new_state is None:
                 return
 
-            old = old_state.state
-            new = new_state.state
+            # The media player is back, stop backing off
+            if (
+                old_state.state in BREAKER_RESET_STATES
+                and new_state.state not in BREAKER_RESET_STATES
+            ):
+                coordinator.async_close_breaker()
 
             # Trigger refresh on meaningful state changes
-            if old != new:
+            if _is_meaningful_change(old_state, new_state):
                 _LOGGER.debug(
-                    "Kodi state changed from %s to %s, triggering refresh", old, new
+                    "Kodi state changed from %s to %s, triggering refresh",
+                    old_state.state,
+                    new_state.state,
                 )
-                hass.async_create_task(coordinator.async_request_refresh())
+                hass.async_create_task(coordinator.state_refresh_debouncer.async_call())
         except Exception as err:
             _LOGGER.debug("Error in state change handler: %s", err)
 
@@ -86,10 +172,68 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def _async_set_artwork_budget(
+    entry: ConfigEntry, artwork_cache: ArtworkCache, source_entity_id: str
+) -> None:
+    """Apply the artwork cache size option to a player's budget."""
+    await artwork_cache.async_set_budget(
+        source_entity_id,
+        entry.options.get(CONF_ARTWORK_CACHE_SIZE, DEFAULT_ARTWORK_CACHE_SIZE)
+        * 1024
+        * 1024,
+    )
+
+
+@callback
+def _async_set_hub_mode(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: KodiStreamDetailsCoordinator
+) -> None:
+    """Join or leave the shared hub according to the hub mode option."""
+    hub_mode = entry.options.get(CONF_HUB_MODE, DEFAULT_HUB_MODE)
+    coordinator.async_set_hub(async_get_hub(hass) if hub_mode else None)
+
+
+def _snapshot_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict[str, Any]]:
+    """Return the store holding the last snapshot of a config entry."""
+    return Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.snapshot.{entry.entry_id}")
+
+
+def _is_meaningful_change(old_state: State, new_state: State) -> bool:
+    """Return True if a source state change can change the stream details.
+
+    Pausing, resuming and attribute-only updates (such as the playback
+    position) keep the same item and its streams, so they are skipped.
+    A different item triggers a refresh even if the state did not change.
+    """
+    same_item = all(
+        old_state.attributes.get(attr) == new_state.attributes.get(attr)
+        for attr in ("media_content_id", "media_title")
+    )
+    if not same_item:
+        return True
+    if old_state.state == new_state.state:
+        return False
+    return not (
+        old_state.state in ACTIVE_PLAYBACK_STATES
+        and new_state.state in ACTIVE_PLAYBACK_STATES
+    )
+
+
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
-    # Reload the integration to apply new options
-    await hass.config_entries.async_reload(entry.entry_id)
+    coordinator: KodiStreamDetailsCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if entry.data[CONF_SOURCE_ENTITY] != coordinator.source_entity_id:
+        # A different player needs new entities, reload the integration
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    # Apply everything else to the running coordinator
+    _LOGGER.debug("Applying new options to %s", coordinator.source_entity_id)
+    await _async_set_artwork_budget(
+        entry, coordinator.artwork_cache, coordinator.source_entity_id
+    )
+    _async_set_hub_mode(hass, entry, coordinator)
+    await coordinator.async_apply_options(entry.options)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -98,3 +242,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored snapshot of a deleted config entry."""
+    await _snapshot_store(hass, entry).async_remove()
@@ -0,0 +1,678 @@
+"""Shared artwork cache for Kodi Stream Details."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import logging
+import mimetypes
+import shutil
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any, BinaryIO, TypeVar
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import ARTWORK_VARIANT_SIZES, DEFAULT_ARTWORK_CACHE_SIZE, DOMAIN
+from .view import ArtworkView
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Private to Home Assistant: images are only served through ArtworkView
+ARTWORK_CACHE_DIR = f".storage/{DOMAIN}/artwork"
+# Earlier versions cached under www, which is also served unauthenticated
+# at /local
+LEGACY_ARTWORK_CACHE_DIR = f"www/{DOMAIN}"
+ARTWORK_URL_BASE = "/api/kodi_streamdetails/artwork"
+DATA_ARTWORK_CACHE = f"{DOMAIN}_artwork_cache"
+
+STORAGE_KEY = f"{DOMAIN}.artwork"
+STORAGE_VERSION = 1
+INDEX_SAVE_DELAY = 10
+
+# Artwork download limits
+ARTWORK_MAX_BYTES = 20 * 1024 * 1024
+ARTWORK_CHUNK_SIZE = 64 * 1024
+ARTWORK_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp", ".gif")
+
+# Cached images are trusted without network access for this long (seconds),
+# then revalidated with a conditional request
+ARTWORK_REVALIDATE_INTERVAL = 24 * 60 * 60
+
+# Resized variant encoding
+VARIANT_JPEG_QUALITY = 85
+VARIANT_WEBP_QUALITY = 80
+
+
+async def async_get_artwork_cache(hass: HomeAssistant) -> ArtworkCache:
+    """Return the artwork cache shared by all configured players."""
+    if (cache := hass.data.get(DATA_ARTWORK_CACHE)) is None:
+        cache = hass.data[DATA_ARTWORK_CACHE] = ArtworkCache(hass)
+        hass.http.register_view(ArtworkView(cache))
+    await cache.async_load()
+    return cache
+
+
+class ArtworkCache:
+    """Content-addressed artwork store with an LRU size budget.
+
+    Images are keyed by a hash of their decoded source URL and shared by all
+    players, so replays and items watched on several players are only
+    downloaded once. They are served by the content hash of the image, so
+    their URLs are stable and clients can cache them indefinitely. The
+    index survives restarts; files it does not know about are removed at
+    startup.
+
+    Upstream ETag and Last-Modified validators are kept in the index, so
+    images older than the revalidation interval are refreshed with a
+    conditional request that costs a 304 when they have not changed.
+
+    Concurrent requests for the same image share one download, and files
+    of an image that is being downloaded or resized are never evicted.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._cache_dir = Path(hass.config.path(ARTWORK_CACHE_DIR))
+        self._legacy_cache_dir = Path(hass.config.path(LEGACY_ARTWORK_CACHE_DIR))
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._entries: dict[str, dict[str, Any]] = {}
+        # Content digest -> cache key and variant id, for serving
+        self._digests: dict[str, tuple[str, str | None]] = {}
+        self._variants_supported = True
+        self._load_lock = asyncio.Lock()
+        # Running downloads and resizes by cache key and variant id, and a
+        # lock held while evicted files are removed
+        self._inflight: dict[tuple[str, str | None], asyncio.Task[Any]] = {}
+        self._evict_lock = asyncio.Lock()
+        self._loaded = False
+        # Budgets (bytes) and in-use keys per owning player
+        self._budgets: dict[str, int] = {}
+        self._pins: dict[str, set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.refreshed = 0
+        self.evictions = 0
+
+    @property
+    def budget(self) -> int:
+        """Return the cache size budget in bytes (the largest configured)."""
+        return max(
+            self._budgets.values(), default=DEFAULT_ARTWORK_CACHE_SIZE * 1024 * 1024
+        )
+
+    @property
+    def size(self) -> int:
+        """Return the total size of cached artwork in bytes."""
+        return sum(_entry_size(entry) for entry in self._entries.values())
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return cache counters for diagnostics."""
+        return {
+            "entries": len(self._entries),
+            "size": self.size,
+            "budget": self.budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "refreshed": self.refreshed,
+            "evictions": self.evictions,
+        }
+
+    async def async_load(self) -> None:
+        """Load the index and remove files it does not reference."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            data = await self._store.async_load() or {}
+            entries = data.get("entries", {})
+            self._entries = await self.hass.async_add_executor_job(
+                self._sync_cleanup, entries
+            )
+            self._async_rebuild_digests()
+            self._loaded = True
+            if self._entries != entries:
+                self._async_schedule_save()
+
+    def _sync_cleanup(self, entries: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """Drop orphaned files and stale index entries (sync, run in executor)."""
+        if self._legacy_cache_dir.is_dir():
+            # Taken out of www once, so cached images stop showing up at /local
+            if self._cache_dir.exists():
+                shutil.rmtree(self._legacy_cache_dir, ignore_errors=True)
+            else:
+                self._cache_dir.parent.mkdir(parents=True, exist_ok=True)
+                shutil.move(self._legacy_cache_dir, self._cache_dir)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        files = {file for entry in entries.values() for file in _entry_files(entry)}
+        for path in self._cache_dir.iterdir():
+            if path.is_dir():
+                # Per-player directories from the old wipe-on-change layout
+                shutil.rmtree(path, ignore_errors=True)
+            elif path.name not in files:
+                path.unlink(missing_ok=True)
+        valid: dict[str, dict[str, Any]] = {}
+        for key, entry in entries.items():
+            path = self._cache_dir / entry["file"]
+            if not path.is_file():
+                continue
+            if "digest" not in entry:
+                # Indexed before artwork was served by content hash
+                entry = {
+                    **entry,
+                    "digest": hashlib.sha256(path.read_bytes()).hexdigest(),
+                    "content_type": _guess_content_type(entry["file"]),
+                }
+            if variants := entry.get("variants"):
+                entry = {
+                    **entry,
+                    "variants": {
+                        variant_id: variant
+                        for variant_id, variant in variants.items()
+                        if (self._cache_dir / variant["file"]).is_file()
+                    },
+                }
+            valid[key] = entry
+        return valid
+
+    async def async_set_budget(self, owner: str, budget: int) -> None:
+        """Set an owner's size budget in bytes and evict down to it."""
+        self._budgets[owner] = budget
+        await self._async_evict()
+
+    @callback
+    def async_pin(self, owner: str, keys: set[str]) -> None:
+        """Protect the artwork an owner is currently showing from eviction."""
+        self._pins[owner] = keys
+
+    @callback
+    def async_remove_owner(self, owner: str) -> None:
+        """Forget an owner's pins and budget."""
+        self._pins.pop(owner, None)
+        self._budgets.pop(owner, None)
+
+    @callback
+    def async_contains(self, key: str) -> bool:
+        """Return True if an image is cached."""
+        return key in self._entries
+
+    @staticmethod
+    def key_for_url(url: str) -> str:
+        """Return the cache key for a source URL."""
+        return hashlib.sha256(url.encode()).hexdigest()[:32]
+
+    async def async_fetch(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        semaphore: asyncio.Semaphore,
+        variants: tuple[str, ...] = (),
+        webp: bool = False,
+    ) -> tuple[str, str, dict[str, str]] | None:
+        """Return the cache key, local URL and variant URLs for an image.
+
+        Downloads the image on a miss, revalidates it once it is older than
+        the revalidation interval and generates any requested resized
+        variants that do not exist yet. A cached image is kept if its
+        revalidation fails.
+        """
+        key = self.key_for_url(url)
+        cached = self._entries.get(key)
+
+        if cached is not None and _is_fresh(cached):
+            self.hits += 1
+            cached["last_used"] = time.time()
+            self._async_schedule_save()
+            entry = cached
+        else:
+            if cached is None:
+                self.misses += 1
+            try:
+                entry = await self._async_single_flight(
+                    (key, None),
+                    lambda: self._async_download(session, url, key, semaphore, cached),
+                )
+            except (aiohttp.ClientError, TimeoutError) as err:
+                if cached is None:
+                    raise
+                _LOGGER.debug("Error revalidating %s, using cached copy: %s", url, err)
+                entry = None
+            if entry is None:
+                if cached is None or key not in self._entries:
+                    return None
+                entry = cached
+
+        variant_urls = await self._async_ensure_variants(key, entry, variants, webp)
+        return key, f"{ARTWORK_URL_BASE}/{entry['digest']}", variant_urls
+
+    @callback
+    def async_lookup(
+        self, url: str, variants: tuple[str, ...] = (), webp: bool = False
+    ) -> tuple[str, str, dict[str, str]] | None:
+        """Return a cached image like async_fetch, without any I/O.
+
+        Returns None unless the image is fresh and all requested variants
+        exist, in which case async_fetch has work to do.
+        """
+        key = self.key_for_url(url)
+        if (entry := self._entries.get(key)) is None or not _is_fresh(entry):
+            return None
+        variant_urls: dict[str, str] = {}
+        if self._variants_supported:
+            for name in variants:
+                if name not in ARTWORK_VARIANT_SIZES:
+                    continue
+                variant_id = f"{name}.webp" if webp else name
+                if (variant := entry.get("variants", {}).get(variant_id)) is None:
+                    return None
+                variant_urls[name] = f"{ARTWORK_URL_BASE}/{variant['digest']}"
+        self.hits += 1
+        entry["last_used"] = time.time()
+        self._async_schedule_save()
+        return key, f"{ARTWORK_URL_BASE}/{entry['digest']}", variant_urls
+
+    async def _async_download(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        key: str,
+        semaphore: asyncio.Semaphore,
+        cached: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | None:
+        """Download an image into the cache, return its index entry.
+
+        With a cached entry the request is conditional on its validators; a
+        304 only marks the entry as validated.
+        """
+        # Get file extension from URL or default to jpg
+        ext = Path(url.split("?")[0]).suffix.lower() or ".jpg"
+        if ext not in ARTWORK_EXTENSIONS:
+            ext = ".jpg"
+        filename = f"{key}{ext}"
+
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if cached.get("etag"):
+                headers[aiohttp.hdrs.IF_NONE_MATCH] = cached["etag"]
+            if cached.get("last_modified"):
+                headers[aiohttp.hdrs.IF_MODIFIED_SINCE] = cached["last_modified"]
+
+        async with semaphore, session.get(
+            url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            if response.status == 304 and self._entries.get(key) is cached:
+                self.not_modified += 1
+                cached["validated_at"] = cached["last_used"] = time.time()
+                self._async_schedule_save()
+                return cached
+            if response.status != 200:
+                _LOGGER.debug("Failed to download %s: HTTP %s", url, response.status)
+                return None
+            if (response.content_length or 0) > ARTWORK_MAX_BYTES:
+                _LOGGER.debug(
+                    "Skipping %s: %s bytes exceeds the artwork size limit",
+                    url,
+                    response.content_length,
+                )
+                return None
+            # Let an eviction that is removing this file finish first
+            async with self._evict_lock:
+                pass
+            content_type = response.content_type
+            etag = response.headers.get(aiohttp.hdrs.ETAG)
+            last_modified = response.headers.get(aiohttp.hdrs.LAST_MODIFIED)
+            written = await self._async_stream_to_file(response, self._cache_dir / filename)
+            if written is None:
+                return None
+
+        size, digest = written
+        if not content_type.startswith("image/"):
+            content_type = _guess_content_type(filename)
+        now = time.time()
+        entry = self._entries[key] = {
+            "file": filename,
+            "url": url,
+            "size": size,
+            "digest": digest,
+            "content_type": content_type,
+            "etag": etag,
+            "last_modified": last_modified,
+            "validated_at": now,
+            "last_used": now,
+            "variants": {},
+        }
+        if cached is not None:
+            # The image changed upstream, its variants are out of date
+            self.refreshed += 1
+            stale = _entry_files(cached) - {filename}
+            if stale:
+                await self.hass.async_add_executor_job(
+                    self._sync_remove_files, list(stale)
+                )
+            self._async_rebuild_digests()
+        else:
+            self._digests.setdefault(digest, (key, None))
+        _LOGGER.debug("Cached artwork %s as %s", url, filename)
+        await self._async_evict()
+        self._async_schedule_save()
+        return entry
+
+    async def _async_ensure_variants(
+        self,
+        key: str,
+        entry: dict[str, Any],
+        variants: tuple[str, ...],
+        webp: bool,
+    ) -> dict[str, str]:
+        """Return variant URLs for an image, generating missing variants once."""
+        urls: dict[str, str] = {}
+        created = False
+        for name in variants:
+            if not self._variants_supported:
+                break
+            if name not in ARTWORK_VARIANT_SIZES:
+                continue
+            variant_id = f"{name}.webp" if webp else name
+            variant = entry.setdefault("variants", {}).get(variant_id)
+            if variant is None:
+                try:
+                    variant = await self._async_single_flight(
+                        (key, variant_id),
+                        lambda name=name, variant_id=variant_id: self._async_make_variant(
+                            key, entry, name, variant_id, webp
+                        ),
+                    )
+                except ImportError:
+                    _LOGGER.warning(
+                        "Pillow is not installed, artwork variants are disabled"
+                    )
+                    self._variants_supported = False
+                    break
+                if variant is None:
+                    continue
+                created = True
+            urls[name] = f"{ARTWORK_URL_BASE}/{variant['digest']}"
+
+        if created:
+            await self._async_evict()
+            self._async_schedule_save()
+        return urls
+
+    async def _async_make_variant(
+        self, key: str, entry: dict[str, Any], name: str, variant_id: str, webp: bool
+    ) -> dict[str, Any] | None:
+        """Generate a resized variant and add it to an index entry."""
+        variant = await self.hass.async_add_executor_job(
+            self._sync_make_variant,
+            entry,
+            f"{key}_{variant_id.replace('.', '_')}",
+            ARTWORK_VARIANT_SIZES[name],
+            webp,
+        )
+        if variant is None or self._entries.get(key) is not entry:
+            return None
+        entry["variants"][variant_id] = variant
+        self._digests.setdefault(variant["digest"], (key, variant_id))
+        return variant
+
+    async def _async_single_flight(
+        self, flight: tuple[str, str | None], factory: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Run a download or resize once, sharing it with concurrent callers.
+
+        The work runs in its own task, so a caller that is cancelled (such
+        as a coordinator whose media changed) does not abort it for others.
+        """
+        if (task := self._inflight.get(flight)) is None:
+            task = self.hass.async_create_background_task(
+                factory(), name=f"{DOMAIN} artwork {flight[0]}"
+            )
+            self._inflight[flight] = task
+            task.add_done_callback(lambda done: self._async_flight_done(flight, done))
+        return await asyncio.shield(task)
+
+    @callback
+    def _async_flight_done(
+        self, flight: tuple[str, str | None], task: asyncio.Task[Any]
+    ) -> None:
+        """Forget a finished flight, retrieving errors nobody waited for."""
+        if self._inflight.get(flight) is task:
+            del self._inflight[flight]
+        if not task.cancelled():
+            task.exception()
+
+    def _sync_make_variant(
+        self, entry: dict[str, Any], stem: str, max_size: int, webp: bool
+    ) -> dict[str, Any] | None:
+        """Resize an image to fit a square box (sync, run in executor).
+
+        Images that already fit and need no re-encoding reuse the original
+        file. Raises ImportError if Pillow is not installed.
+        """
+        # Imported lazily, Pillow is optional
+        from PIL import Image
+
+        source = self._cache_dir / entry["file"]
+        try:
+            with Image.open(source) as image:
+                image_format = image.format or "JPEG"
+                if not webp and max(image.size) <= max_size:
+                    return _variant_of(entry)
+                image.thumbnail((max_size, max_size))
+                if webp:
+                    image_format, ext = "WEBP", ".webp"
+                    options = {"quality": VARIANT_WEBP_QUALITY}
+                elif image_format == "JPEG":
+                    ext = ".jpg"
+                    options = {"quality": VARIANT_JPEG_QUALITY, "optimize": True}
+                    if image.mode not in ("RGB", "L"):
+                        image = image.convert("RGB")
+                else:
+                    ext = Path(entry["file"]).suffix
+                    options = {}
+                buffer = io.BytesIO()
+                image.save(buffer, image_format, **options)
+        except (OSError, ValueError, Image.DecompressionBombError) as err:
+            # The original is still served
+            _LOGGER.debug("Error resizing artwork %s: %s", entry["file"], err)
+            return None
+
+        content = buffer.getvalue()
+        filename = f"{stem}{ext}"
+        try:
+            (self._cache_dir / filename).write_bytes(content)
+        except OSError as err:
+            _LOGGER.debug("Error writing artwork variant %s: %s", filename, err)
+            return None
+        return {
+            "file": filename,
+            "size": len(content),
+            "digest": hashlib.sha256(content).hexdigest(),
+            "content_type": _guess_content_type(filename),
+        }
+
+    @callback
+    def async_resolve(self, digest: str) -> tuple[Path, str] | None:
+        """Return the file and content type of an image by content digest."""
+        if (found := self._digests.get(digest)) is None:
+            return None
+        key, variant_id = found
+        entry = self._entries[key]
+        entry["last_used"] = time.time()
+        self._async_schedule_save()
+        image = entry if variant_id is None else entry["variants"][variant_id]
+        return self._cache_dir / image["file"], image["content_type"]
+
+    @callback
+    def _async_rebuild_digests(self) -> None:
+        """Rebuild the digest lookup from the index."""
+        self._digests = {}
+        for key, entry in self._entries.items():
+            self._digests.setdefault(entry["digest"], (key, None))
+            for variant_id, variant in entry.get("variants", {}).items():
+                self._digests.setdefault(variant["digest"], (key, variant_id))
+
+    async def _async_stream_to_file(
+        self, response: aiohttp.ClientResponse, filepath: Path
+    ) -> tuple[int, str] | None:
+        """Stream a response body to disk in chunks, return its size and digest.
+
+        Writes to a temporary file that replaces the target only once the
+        whole body arrived, so a cancelled or aborted download never leaves
+        a truncated image behind. Each chunk is written by its own executor
+        job, so no executor thread waits on the network. Returns None if
+        the body was oversized or could not be written.
+        """
+        partial = filepath.with_name(f"{filepath.name}.{id(response):x}.part")
+        try:
+            file = await self.hass.async_add_executor_job(
+                self._sync_open_partial, partial
+            )
+        except OSError as err:
+            _LOGGER.debug("Error writing artwork %s: %s", filepath, err)
+            return None
+        sha256 = hashlib.sha256()
+        size = 0
+        complete = False
+        try:
+            async for chunk in response.content.iter_chunked(ARTWORK_CHUNK_SIZE):
+                size += len(chunk)
+                if size > ARTWORK_MAX_BYTES:
+                    _LOGGER.debug("Aborted %s: exceeds the artwork size limit", filepath.name)
+                    break
+                sha256.update(chunk)
+                await self.hass.async_add_executor_job(file.write, chunk)
+            else:
+                complete = True
+        except OSError as err:
+            # Stop reading the body as soon as a write fails
+            _LOGGER.debug("Error writing artwork %s: %s", filepath, err)
+        finally:
+            complete = await asyncio.shield(
+                self.hass.async_add_executor_job(
+                    _sync_close_partial, file, partial, filepath, complete
+                )
+            )
+        if complete:
+            return size, sha256.hexdigest()
+        return None
+
+    def _sync_open_partial(self, partial: Path) -> BinaryIO:
+        """Open the temporary file of a download (sync, run in executor)."""
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        return partial.open("wb")
+
+    async def _async_evict(self) -> None:
+        """Remove least recently used artwork until the cache fits its budget."""
+        async with self._evict_lock:
+            budget = self.budget
+            size = self.size
+            if size <= budget:
+                return
+
+            # Images in use or being written are kept
+            pinned = set().union(*self._pins.values())
+            pinned.update(key for key, _ in self._inflight)
+            evicted: list[str] = []
+            for key, entry in sorted(
+                self._entries.items(), key=lambda item: item[1]["last_used"]
+            ):
+                if size <= budget:
+                    break
+                if key in pinned:
+                    continue
+                size -= _entry_size(entry)
+                evicted.extend(_entry_files(entry))
+                del self._entries[key]
+
+            if evicted:
+                self._async_rebuild_digests()
+                self.evictions += 1
+                _LOGGER.debug(
+                    "Evicting %s artwork files to fit the cache budget", len(evicted)
+                )
+                await self.hass.async_add_executor_job(self._sync_remove_files, evicted)
+                self._async_schedule_save()
+
+    def _sync_remove_files(self, filenames: list[str]) -> None:
+        """Delete cached files (sync, run in executor)."""
+        for filename in filenames:
+            (self._cache_dir / filename).unlink(missing_ok=True)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Persist the index after a short delay."""
+        self._store.async_delay_save(self._data_to_save, INDEX_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the index to persist."""
+        return {"entries": self._entries}
+
+
+def _guess_content_type(filename: str) -> str:
+    """Return the content type for a cached file name."""
+    return mimetypes.guess_type(filename)[0] or "image/jpeg"
+
+
+def _variant_of(entry: dict[str, Any]) -> dict[str, Any]:
+    """Return a variant record that reuses the original image."""
+    return {
+        "file": entry["file"],
+        "size": 0,
+        "digest": entry["digest"],
+        "content_type": entry["content_type"],
+    }
+
+
+def _entry_size(entry: dict[str, Any]) -> int:
+    """Return the bytes used by an image and its variants."""
+    return entry["size"] + sum(
+        variant["size"] for variant in entry.get("variants", {}).values()
+    )
+
+
+def _entry_files(entry: dict[str, Any]) -> set[str]:
+    """Return the files used by an image and its variants."""
+    return {entry["file"]} | {
+        variant["file"] for variant in entry.get("variants", {}).values()
+    }
+
+
+def _is_fresh(entry: dict[str, Any]) -> bool:
+    """Return whether a cached image can be used without revalidating it.
+
+    Images without validators cannot be revalidated cheaply and are kept
+    until they are evicted.
+    """
+    if not entry.get("etag") and not entry.get("last_modified"):
+        return True
+    return time.time() - entry.get("validated_at", 0) < ARTWORK_REVALIDATE_INTERVAL
+
+
+def _sync_close_partial(
+    file: BinaryIO, partial: Path, filepath: Path, commit: bool
+) -> bool:
+    """Close a download's temporary file, moving it into place if complete.
+
+    Returns True if the file was committed (sync, run in executor).
+    """
+    try:
+        file.close()
+        if commit:
+            partial.replace(filepath)
+            return True
+    except OSError as err:
+        _LOGGER.debug("Error writing artwork %s: %s", filepath, err)
+    partial.unlink(missing_ok=True)
+    return False
@@ -9,15 +9,50 @@ import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, ConfigFlowResult, OptionsFlow
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers.selector import (
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
 
 from .const import (
+    ARTWORK_VARIANT_SIZES,
+    CONF_ADAPTIVE_POLLING,
+    CONF_ARTWORK_CACHE_SIZE,
+    CONF_ARTWORK_VARIANTS,
+    CONF_ARTWORK_WEBP,
+    CONF_HUB_MODE,
+    CONF_POLL_CEILING,
+    CONF_POLL_FLOOR,
     CONF_POLL_INTERVAL,
+    CONF_PUSH_UPDATES,
     CONF_SOURCE_ENTITY,
+    CONF_STATE_DEBOUNCE,
+    CONF_STREAM_ATTRIBUTE_LIMIT,
+    CONF_TRANSPORT,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_ARTWORK_CACHE_SIZE,
+    DEFAULT_ARTWORK_VARIANTS,
+    DEFAULT_ARTWORK_WEBP,
+    DEFAULT_HUB_MODE,
+    DEFAULT_POLL_CEILING,
+    DEFAULT_POLL_FLOOR,
     DEFAULT_POLL_INTERVAL,
+    DEFAULT_PUSH_UPDATES,
+    DEFAULT_STATE_DEBOUNCE,
+    DEFAULT_STREAM_ATTRIBUTE_LIMIT,
+    DEFAULT_TRANSPORT,
     DOMAIN,
+    MAX_ARTWORK_CACHE_SIZE,
+    MAX_POLL_CEILING,
     MAX_POLL_INTERVAL,
+    MAX_STATE_DEBOUNCE,
+    MAX_STREAM_ATTRIBUTE_LIMIT,
+    MIN_ARTWORK_CACHE_SIZE,
     MIN_POLL_INTERVAL,
+    TRANSPORT_HTTP,
+    TRANSPORT_KODI,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -108,12 +143,35 @@ class KodiStreamDetailsOptionsFlow(OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Manage the options."""
+        errors: dict[str, str] = {}
+
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            if user_input[CONF_POLL_FLOOR] > user_input[CONF_POLL_CEILING]:
+                errors["base"] = "invalid_poll_bounds"
+            else:
+                return self.async_create_entry(title="", data=user_input)
 
-        # Get current values
-        current_poll_interval = self.config_entry.options.get(
-            CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL
+        # Get current values (the rejected input, if any, takes precedence)
+        options = {**self.config_entry.options, **(user_input or {})}
+        current_poll_interval = options.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL)
+        current_push_updates = options.get(CONF_PUSH_UPDATES, DEFAULT_PUSH_UPDATES)
+        current_state_debounce = options.get(CONF_STATE_DEBOUNCE, DEFAULT_STATE_DEBOUNCE)
+        current_adaptive_polling = options.get(
+            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        )
+        current_poll_floor = options.get(CONF_POLL_FLOOR, DEFAULT_POLL_FLOOR)
+        current_poll_ceiling = options.get(CONF_POLL_CEILING, DEFAULT_POLL_CEILING)
+        current_artwork_cache_size = options.get(
+            CONF_ARTWORK_CACHE_SIZE, DEFAULT_ARTWORK_CACHE_SIZE
+        )
+        current_artwork_variants = options.get(
+            CONF_ARTWORK_VARIANTS, DEFAULT_ARTWORK_VARIANTS
+        )
+        current_artwork_webp = options.get(CONF_ARTWORK_WEBP, DEFAULT_ARTWORK_WEBP)
+        current_hub_mode = options.get(CONF_HUB_MODE, DEFAULT_HUB_MODE)
+        current_transport = options.get(CONF_TRANSPORT, DEFAULT_TRANSPORT)
+        current_stream_attribute_limit = options.get(
+            CONF_STREAM_ATTRIBUTE_LIMIT, DEFAULT_STREAM_ATTRIBUTE_LIMIT
         )
 
         schema = vol.Schema(
@@ -125,10 +183,81 @@ class KodiStreamDetailsOptionsFlow(OptionsFlow):
                     vol.Coerce(int),
                     vol.Range(min=MIN_POLL_INTERVAL, max=MAX_POLL_INTERVAL),
                 ),
+                vol.Optional(
+                    CONF_PUSH_UPDATES,
+                    default=current_push_updates,
+                ): bool,
+                vol.Optional(
+                    CONF_STATE_DEBOUNCE,
+                    default=current_state_debounce,
+                ): vol.All(
+                    vol.Coerce(float),
+                    vol.Range(min=0, max=MAX_STATE_DEBOUNCE),
+                ),
+                vol.Optional(
+                    CONF_TRANSPORT,
+                    default=current_transport,
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=[TRANSPORT_KODI, TRANSPORT_HTTP],
+                        mode=SelectSelectorMode.DROPDOWN,
+                        translation_key=CONF_TRANSPORT,
+                    )
+                ),
+                vol.Optional(
+                    CONF_HUB_MODE,
+                    default=current_hub_mode,
+                ): bool,
+                vol.Optional(
+                    CONF_ADAPTIVE_POLLING,
+                    default=current_adaptive_polling,
+                ): bool,
+                vol.Optional(
+                    CONF_POLL_FLOOR,
+                    default=current_poll_floor,
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=MIN_POLL_INTERVAL, max=MAX_POLL_INTERVAL),
+                ),
+                vol.Optional(
+                    CONF_POLL_CEILING,
+                    default=current_poll_ceiling,
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=MIN_POLL_INTERVAL, max=MAX_POLL_CEILING),
+                ),
+                vol.Optional(
+                    CONF_ARTWORK_CACHE_SIZE,
+                    default=current_artwork_cache_size,
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=MIN_ARTWORK_CACHE_SIZE, max=MAX_ARTWORK_CACHE_SIZE),
+                ),
+                vol.Optional(
+                    CONF_ARTWORK_VARIANTS,
+                    default=current_artwork_variants,
+                ): cv.multi_select(
+                    {
+                        name: f"{name.title()} ({size}px)"
+                        for name, size in ARTWORK_VARIANT_SIZES.items()
+                    }
+                ),
+                vol.Optional(
+                    CONF_ARTWORK_WEBP,
+                    default=current_artwork_webp,
+                ): bool,
+                vol.Optional(
+                    CONF_STREAM_ATTRIBUTE_LIMIT,
+                    default=current_stream_attribute_limit,
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=0, max=MAX_STREAM_ATTRIBUTE_LIMIT),
+                ),
             }
         )
 
         return self.async_show_form(
             step_id="init",
             data_schema=schema,
+            errors=errors,
         )
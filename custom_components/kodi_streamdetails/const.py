@@ -10,6 +10,74 @@ CONF_POLL_INTERVAL: Final = "poll_interval"
 DEFAULT_POLL_INTERVAL: Final = 5
 MIN_POLL_INTERVAL: Final = 1
 MAX_POLL_INTERVAL: Final = 60
+CONF_PUSH_UPDATES: Final = "push_updates"
+DEFAULT_PUSH_UPDATES: Final = False
+CONF_ADAPTIVE_POLLING: Final = "adaptive_polling"
+DEFAULT_ADAPTIVE_POLLING: Final = False
+CONF_POLL_FLOOR: Final = "poll_floor"
+DEFAULT_POLL_FLOOR: Final = 2
+CONF_POLL_CEILING: Final = "poll_ceiling"
+DEFAULT_POLL_CEILING: Final = 120
+MAX_POLL_CEILING: Final = 900
+CONF_ARTWORK_CACHE_SIZE: Final = "artwork_cache_size"
+DEFAULT_ARTWORK_CACHE_SIZE: Final = 200  # MB, shared by all players
+MIN_ARTWORK_CACHE_SIZE: Final = 10
+MAX_ARTWORK_CACHE_SIZE: Final = 10000
+CONF_ARTWORK_VARIANTS: Final = "artwork_variants"
+DEFAULT_ARTWORK_VARIANTS: Final[list[str]] = []
+CONF_ARTWORK_WEBP: Final = "artwork_webp"
+DEFAULT_ARTWORK_WEBP: Final = False
+CONF_STATE_DEBOUNCE: Final = "state_debounce"
+DEFAULT_STATE_DEBOUNCE: Final = 1.0
+MAX_STATE_DEBOUNCE: Final = 30.0
+CONF_HUB_MODE: Final = "hub_mode"
+DEFAULT_HUB_MODE: Final = False
+CONF_TRANSPORT: Final = "transport"
+TRANSPORT_KODI: Final = "kodi"  # the Kodi integration's pykodi connection
+TRANSPORT_HTTP: Final = "http"  # built-in JSON-RPC client
+DEFAULT_TRANSPORT: Final = TRANSPORT_KODI
+CONF_STREAM_ATTRIBUTE_LIMIT: Final = "stream_attribute_limit"
+DEFAULT_STREAM_ATTRIBUTE_LIMIT: Final = 10  # tracks listed per stream sensor
+MAX_STREAM_ATTRIBUTE_LIMIT: Final = 100
+
+# Services
+SERVICE_GET_STREAMS: Final = "get_streams"
+
+# Resized artwork variants (longest side in pixels)
+ARTWORK_VARIANT_SIZES: Final = {
+    "thumbnail": 160,
+    "card": 480,
+    "hd": 1280,
+}
+
+# Push updates (Kodi JSON-RPC notifications over the websocket)
+PUSH_SAFETY_POLL_INTERVAL: Final = 60
+PUSH_REFRESH_COOLDOWN: Final = 0.5
+
+# Adaptive polling
+ADAPTIVE_BURST_POLLS: Final = 3  # polls at the floor after a transition
+ADAPTIVE_STEADY_FACTOR: Final = 6  # steady playback interval, x poll interval
+ADAPTIVE_IDLE_STATES: Final = ("off", "idle", "unavailable", "unknown")
+
+# Circuit breaker for unreachable Kodi hosts
+BREAKER_FAILURE_THRESHOLD: Final = 3  # failed updates before backing off
+BREAKER_BASE_BACKOFF: Final = 10  # seconds, doubled after each failed probe
+BREAKER_MAX_BACKOFF: Final = 300
+BREAKER_RESET_STATES: Final = ("off", "unavailable")
+
+# Last published snapshot, restored at startup
+SNAPSHOT_STORAGE_VERSION: Final = 1
+SNAPSHOT_SAVE_DELAY: Final = 30
+
+# Built-in JSON-RPC client
+RPC_TIMEOUT: Final = 5
+
+# Hub mode (one staggered scheduler for all players)
+HUB_MAX_RPCS_IN_FLIGHT: Final = 8
+HUB_LATENCY_SMOOTHING: Final = 0.2  # weight of the newest poll in the average
+
+# Source states that keep the same item loaded
+ACTIVE_PLAYBACK_STATES: Final = ("playing", "paused")
 
 # Video codec normalization
 VIDEO_CODEC_MAP: Final = {
@@ -117,6 +185,15 @@ RESOLUTION_THRESHOLDS: Final = [
     (0, "SD"),
 ]
 
+# Heights that reach an HD tier for encodes cropped at the sides to no
+# narrower than 4:3 (1440x1080 is 1080p). SD tiers go by width alone, so
+# a 640x480 video stays SD.
+RESOLUTION_HEIGHT_THRESHOLDS: Final = [
+    (2160, "4K"),
+    (1080, "1080p"),
+    (720, "720p"),
+]
+
 # Common aspect ratios for display
 ASPECT_RATIO_NAMES: Final = {
     2.39: "2.39:1",
@@ -132,16 +209,38 @@ ASPECT_RATIO_NAMES: Final = {
     1.90: "1.90:1",
 }
 
-# Sensor definitions
+# Largest difference from a known aspect ratio that still uses its name
+ASPECT_RATIO_TOLERANCE: Final = 0.05
+
+# Channel count to standard layout notation
+CHANNEL_LAYOUTS: Final = {
+    1: "1.0",
+    2: "2.0",
+    3: "2.1",
+    6: "5.1",
+    7: "6.1",
+    8: "7.1",
+}
+
+# Distinct raw values remembered by each normalization function
+NORMALIZE_CACHE_SIZE: Final = 256
+
+# Sensor definitions. The state is read from the "value" data key (the
+# sensor type by default). "attributes" maps attribute names to data keys
+# and skips empty values, "always_attributes" keeps them, and the
+# mappings under the "attribute_maps" data keys are merged in as is.
 SENSOR_TYPES: Final = {
     # Video sensors
     "video_codec": {
         "name": "Video Codec",
         "icon": "mdi:video",
+        "value": "video_codec_display",
+        "attributes": {"raw_codec": "video_codec_raw", "normalized": "video_codec"},
     },
     "video_resolution": {
         "name": "Video Resolution",
         "icon": "mdi:television",
+        "attributes": {"width": "video_width", "height": "video_height"},
     },
     "video_width": {
         "name": "Video Width",
@@ -156,10 +255,16 @@ SENSOR_TYPES: Final = {
     "video_aspect": {
         "name": "Aspect Ratio",
         "icon": "mdi:aspect-ratio",
+        "attributes": {"raw_aspect": "video_aspect_raw"},
     },
     "video_hdr_type": {
         "name": "HDR Type",
         "icon": "mdi:hdr",
+        "value": "video_hdr_type_display",
+        "attributes": {
+            "raw_hdrtype": "video_hdr_type_raw",
+            "normalized": "video_hdr_type",
+        },
     },
     "video_stereo_mode": {
         "name": "3D Mode",
@@ -169,19 +274,24 @@ SENSOR_TYPES: Final = {
         "name": "Duration",
         "icon": "mdi:timer-outline",
         "unit": "s",
+        "attributes": {"formatted": "video_duration_formatted"},
     },
     # Audio sensors
     "audio_codec": {
         "name": "Audio Codec",
         "icon": "mdi:surround-sound",
+        "value": "audio_codec_display",
+        "attributes": {"raw_codec": "audio_codec_raw", "normalized": "audio_codec"},
     },
     "audio_channels": {
         "name": "Audio Channels",
         "icon": "mdi:speaker-multiple",
+        "attributes": {"raw_channels": "audio_channels_raw"},
     },
     "audio_language": {
         "name": "Audio Language",
         "icon": "mdi:translate",
+        "attributes": {"language_name": "audio_language_name"},
     },
     "audio_name": {
         "name": "Audio Track Name",
@@ -191,6 +301,7 @@ SENSOR_TYPES: Final = {
         "name": "Audio Bitrate",
         "icon": "mdi:speedometer",
         "unit": "bps",
+        "attributes": {"formatted": "audio_bitrate_formatted"},
     },
     "audio_stream_index": {
         "name": "Audio Stream Index",
@@ -199,6 +310,10 @@ SENSOR_TYPES: Final = {
     "audio_stream_count": {
         "name": "Audio Stream Count",
         "icon": "mdi:playlist-music",
+        "attributes": {
+            "summary": "audio_streams_summary",
+            "streams": "audio_streams",
+        },
     },
     "audio_is_default": {
         "name": "Audio Is Default",
@@ -216,6 +331,7 @@ SENSOR_TYPES: Final = {
     "subtitle_language": {
         "name": "Subtitle Language",
         "icon": "mdi:translate",
+        "attributes": {"language_name": "subtitle_language_name"},
     },
     "subtitle_name": {
         "name": "Subtitle Track Name",
@@ -228,6 +344,10 @@ SENSOR_TYPES: Final = {
     "subtitle_stream_count": {
         "name": "Subtitle Stream Count",
         "icon": "mdi:playlist-plus",
+        "attributes": {
+            "summary": "subtitle_streams_summary",
+            "streams": "subtitle_streams",
+        },
     },
     "subtitle_is_forced": {
         "name": "Subtitle Is Forced",
@@ -241,11 +361,14 @@ SENSOR_TYPES: Final = {
     "playback_type": {
         "name": "Playback Type",
         "icon": "mdi:play-circle",
+        "always_attributes": {"media_type": "playback_type"},
     },
     # Artwork sensor
     "artwork_count": {
         "name": "Artwork",
         "icon": "mdi:image-multiple",
+        # Every artwork URL, then the resized variants keyed like poster_card
+        "attribute_maps": ("artwork", "artwork_variants"),
     },
 }
 
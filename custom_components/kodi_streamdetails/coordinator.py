@@ -2,77 +2,410 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import hashlib
+import inspect
 import logging
 import time
+from collections.abc import Awaitable, Callable, Mapping
 from datetime import timedelta
-from pathlib import Path
+from functools import partial
 from typing import Any
 from urllib.parse import unquote
 
 import aiohttp
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import (
+    SIGNAL_CONFIG_ENTRY_CHANGED,
+    ConfigEntry,
+    ConfigEntryChange,
+    ConfigEntryState,
+)
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_PORT, CONF_SSL, CONF_USERNAME
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import (
+    REQUEST_REFRESH_DEFAULT_COOLDOWN,
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
+from .artwork import ArtworkCache
 from .const import (
-    AUDIO_CODEC_DISPLAY,
-    AUDIO_CODEC_MAP,
-    ASPECT_RATIO_NAMES,
+    ADAPTIVE_BURST_POLLS,
+    ADAPTIVE_IDLE_STATES,
+    ADAPTIVE_STEADY_FACTOR,
+    BREAKER_BASE_BACKOFF,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_BACKOFF,
+    CONF_ADAPTIVE_POLLING,
+    CONF_ARTWORK_VARIANTS,
+    CONF_ARTWORK_WEBP,
+    CONF_POLL_CEILING,
+    CONF_POLL_FLOOR,
+    CONF_POLL_INTERVAL,
+    CONF_PUSH_UPDATES,
+    CONF_STATE_DEBOUNCE,
+    CONF_STREAM_ATTRIBUTE_LIMIT,
+    CONF_TRANSPORT,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_ARTWORK_VARIANTS,
+    DEFAULT_ARTWORK_WEBP,
+    DEFAULT_POLL_CEILING,
+    DEFAULT_POLL_FLOOR,
     DEFAULT_POLL_INTERVAL,
+    DEFAULT_PUSH_UPDATES,
+    DEFAULT_STATE_DEBOUNCE,
+    DEFAULT_STREAM_ATTRIBUTE_LIMIT,
+    DEFAULT_TRANSPORT,
     DOMAIN,
-    HDR_TYPE_DISPLAY,
-    HDR_TYPE_MAP,
     LANGUAGE_NAMES,
-    RESOLUTION_THRESHOLDS,
-    VIDEO_CODEC_DISPLAY,
-    VIDEO_CODEC_MAP,
+    MIN_POLL_INTERVAL,
+    PUSH_REFRESH_COOLDOWN,
+    PUSH_SAFETY_POLL_INTERVAL,
+    SENSOR_TYPES,
+    SNAPSHOT_SAVE_DELAY,
+    TRANSPORT_HTTP,
+)
+from .hub import KodiStreamDetailsHub
+from .normalize import (
+    annotate_audio_stream,
+    annotate_subtitle_stream,
+    derive_resolution,
+    format_aspect,
+    format_channels,
+    normalize_audio_codec,
+    normalize_hdr_type,
+    normalize_video_codec,
+    summarize_audio_streams,
+    summarize_subtitle_streams,
 )
+from .rpc import KodiJsonRpcClient
+from .snapshot import EMPTY_SNAPSHOT, StreamSnapshot, build_sensor_state
 
 _LOGGER = logging.getLogger(__name__)
 
 KODI_DOMAIN = "kodi"
-ARTWORK_CACHE_DIR = "www/kodi_streamdetails"
 
 # Only cache essential artwork types
 ARTWORK_TO_CACHE = {"poster", "fanart", "clearlogo"}
 
+# Concurrent artwork downloads per coordinator
+ARTWORK_MAX_CONCURRENT_DOWNLOADS = 3
+
+# Properties requested on every poll: the track selection and enough of
+# the playing item to tell when it changes
+ITEM_IDENTITY_PROPERTIES = ["file"]
+SELECTION_PROPERTIES = ["currentaudiostream", "currentsubtitle", "subtitleenabled"]
+
+# Properties only requested when the playing item changes
+ITEM_PROPERTIES = ["file", "streamdetails", "art", "thumbnail"]
+STREAM_LIST_PROPERTIES = ["audiostreams", "subtitles"]
+
+# Properties used to find the next item in the playing playlist
+PLAYLIST_POSITION_PROPERTIES = ["playlistid", "position"]
+
+# Polls that refetch an item whose stream details Kodi has not reported yet
+MAX_FULL_FETCH_RETRIES = 3
+
+# Consecutive pipelined polls that must fail before falling back for good
+MAX_PIPELINE_FAILURES = 3
+
+# Consecutive failed updates over the built-in client before falling back
+# to the Kodi integration's connection
+MAX_TRANSPORT_FAILURES = 3
+
+# Kodi notifications that can change what the sensors show
+PUSH_NOTIFICATIONS = (
+    "Player.OnAVStart",
+    "Player.OnAVChange",
+    "Player.OnStop",
+    "Player.OnPropertyChanged",
+)
 
-class KodiStreamDetailsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+
+def _request_cooldown(push_updates: bool) -> float:
+    """Return the cooldown between requested refreshes."""
+    return PUSH_REFRESH_COOLDOWN if push_updates else REQUEST_REFRESH_DEFAULT_COOLDOWN
+
+
+class AdaptivePollScheduler:
+    """Pick the next poll interval from what Kodi is doing.
+
+    Polls at the floor for a few cycles after playback starts or the media
+    changes, relaxes towards a long steady-state interval during stable
+    playback, and backs off exponentially up to the ceiling while idle.
+    """
+
+    def __init__(self, base: float, floor: float, ceiling: float) -> None:
+        """Initialize the scheduler."""
+        self.base = base
+        self.floor = min(floor, ceiling)
+        self.ceiling = ceiling
+        self.interval = base
+        self._burst_remaining = 0
+        self._media_key: Any = None
+
+    @property
+    def steady_interval(self) -> float:
+        """Return the interval used during stable playback."""
+        return min(max(self.base * ADAPTIVE_STEADY_FACTOR, self.floor), self.ceiling)
+
+    def update(self, playing: bool, media_key: Any = None) -> float:
+        """Record the outcome of a poll and return the next interval."""
+        if playing and media_key != self._media_key:
+            # Playback started or the media changed
+            self._burst_remaining = ADAPTIVE_BURST_POLLS
+        self._media_key = media_key if playing else None
+
+        if self._burst_remaining:
+            self._burst_remaining -= 1
+            self.interval = self.floor
+        else:
+            limit = self.steady_interval if playing else self.ceiling
+            self.interval = min(max(self.interval * 2, self.base, self.floor), limit)
+        return self.interval
+
+
+class CircuitBreaker:
+    """Stop polling an unreachable Kodi and probe it with exponential backoff.
+
+    Opens after a number of consecutive failed updates. While open no
+    requests are sent until the backoff expires; the next update is then
+    allowed to probe Kodi (half open). A failed probe doubles the backoff,
+    a successful update closes the breaker.
+    """
+
+    def __init__(self, threshold: int, base: float, maximum: float) -> None:
+        """Initialize the breaker."""
+        self.threshold = threshold
+        self.base = base
+        self.maximum = maximum
+        self.failures = 0
+        self.backoff = base
+        self._retry_at: float | None = None
+
+    @property
+    def state(self) -> str:
+        """Return closed, open or half_open."""
+        if self._retry_at is None:
+            return "closed"
+        return "open" if time.monotonic() < self._retry_at else "half_open"
+
+    @property
+    def retry_in(self) -> float | None:
+        """Return the seconds until the next attempt, None if closed."""
+        if self._retry_at is None:
+            return None
+        return max(self._retry_at - time.monotonic(), 0.0)
+
+    def record_success(self) -> None:
+        """Close the breaker."""
+        self.failures = 0
+        self.backoff = self.base
+        self._retry_at = None
+
+    def record_failure(self) -> bool:
+        """Count a failed update, return True if the breaker just opened."""
+        self.failures += 1
+        if self._retry_at is not None:
+            # The probe failed, wait longer before the next one
+            self.backoff = min(self.backoff * 2, self.maximum)
+            self._retry_at = time.monotonic() + self.backoff
+            return False
+        if self.failures >= self.threshold:
+            self._retry_at = time.monotonic() + self.backoff
+            return True
+        return False
+
+
+class KodiStreamDetailsCoordinator(DataUpdateCoordinator[StreamSnapshot]):
     """Coordinator to fetch stream details from Kodi."""
 
     def __init__(
         self,
         hass: HomeAssistant,
         source_entity_id: str,
+        artwork_cache: ArtworkCache,
         poll_interval: int = DEFAULT_POLL_INTERVAL,
+        push_updates: bool = DEFAULT_PUSH_UPDATES,
+        adaptive_polling: bool = DEFAULT_ADAPTIVE_POLLING,
+        poll_floor: int = DEFAULT_POLL_FLOOR,
+        poll_ceiling: int = DEFAULT_POLL_CEILING,
+        artwork_variants: tuple[str, ...] = (),
+        artwork_webp: bool = DEFAULT_ARTWORK_WEBP,
+        state_debounce: float = DEFAULT_STATE_DEBOUNCE,
+        transport: str = DEFAULT_TRANSPORT,
+        stream_attribute_limit: int = DEFAULT_STREAM_ATTRIBUTE_LIMIT,
+        snapshot_store: Store[dict[str, Any]] | None = None,
     ) -> None:
         """Initialize coordinator."""
+        self._request_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=_request_cooldown(push_updates),
+            immediate=True,
+        )
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=poll_interval),
+            request_refresh_debouncer=self._request_debouncer,
+            # Identical refreshes do not notify any entity
+            always_update=False,
         )
         self.source_entity_id = source_entity_id
+        self._poll_interval = timedelta(seconds=poll_interval)
+        self._push_updates = push_updates
+        # Set while a hub schedules the polls (see async_set_hub)
+        self._hub: KodiStreamDetailsHub | None = None
+        self._unsub_hub: CALLBACK_TYPE | None = None
+        # Limits the RPCs in flight, shared with other players in hub mode
+        self._rpc_semaphore: asyncio.Semaphore | None = None
+        self._scheduler_bounds: tuple[int, int, int] | None = None
+        self._scheduler: AdaptivePollScheduler | None = None
+        self._async_set_scheduler(
+            (poll_interval, poll_floor, poll_ceiling) if adaptive_polling else None
+        )
+        # Coalesces bursts of source state changes (play/pause toggles,
+        # reconnect flaps) into one refresh: the first runs at once, the
+        # rest once at the end of the cooldown
+        self.state_refresh_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=state_debounce,
+            immediate=True,
+            function=self.async_refresh,
+        )
         self._kodi = None
+        self._connection = None
+        # Client used for RPC calls: the Kodi integration's pykodi object or
+        # the built-in JSON-RPC client
+        self._transport = transport
+        self._transport_failures = 0
+        # The Kodi config entry the connection was resolved from. The
+        # connection stays cached until that entry is unloaded or changed
+        self._kodi_entry_id: str | None = None
+        self._kodi_entry_data: dict[str, Any] = {}
+        self._unsub_kodi_entry = async_dispatcher_connect(
+            hass, SIGNAL_CONFIG_ENTRY_CHANGED, self._async_kodi_entry_changed
+        )
+        self._breaker = CircuitBreaker(
+            BREAKER_FAILURE_THRESHOLD, BREAKER_BASE_BACKOFF, BREAKER_MAX_BACKOFF
+        )
+        # Notification handlers we installed on the Kodi websocket server,
+        # and the handlers they replaced (chained so the Kodi media player
+        # keeps receiving its own notifications)
+        self._push_server: Any = None
+        self._push_handlers: dict[str, Callable[..., Any]] = {}
+        self._push_originals: dict[str, Callable[..., Any] | None] = {}
+        # Player id from the previous poll, used to pipeline the RPC calls
+        self._last_player_id: int | None = None
+        self._pipelining = True
+        self._pipeline_failures = 0
+        self.fetch_stats: dict[str, Any] = {
+            "mode": None,
+            "tier": None,
+            "duration": None,
+            "sequential_duration": None,
+            "saved": None,
+            "total_saved": 0.0,
+            "pipelined_polls": 0,
+            "selection_polls": 0,
+            "full_polls": 0,
+            "prefetched_polls": 0,
+            "prefetches": 0,
+            "shared_refreshes": 0,
+            "followup_refreshes": 0,
+        }
+        # Fetch shared by overlapping refreshes (scheduled polls, state
+        # changes and push notifications) until it sends its requests
+        self._refresh_task: asyncio.Task[StreamSnapshot] | None = None
+        self._refresh_sent = False
+        # Details of the playing item, refetched only when it changes
+        self._item_identity: tuple[Any, ...] | None = None
+        self._item_details: dict[str, Any] = {}
+        self._stream_lists: dict[str, Any] = {}
+        # Bumped when Kodi reports changed streams; the track lists are
+        # refetched until a full fetch started after the last bump
+        self._stream_generation = 0
+        self._fetched_generation = 0
+        self._full_fetch_retries = 0
+        # Annotated audio and subtitle tracks and their summary, with the
+        # raw list and digest they were built from
+        self._stream_annotations: dict[
+            str,
+            tuple[list[dict[str, Any]], bytes, tuple[ReadOnlyDict, ...], str],
+        ] = {}
+        # Next playlist item, fetched ahead of time for a fast transition
+        self._prefetched_item: dict[str, Any] | None = None
+        self._prefetch_task: asyncio.Task[None] | None = None
+        # Data and availability the listeners were last notified about
+        self._published_data: StreamSnapshot | None = None
+        self._published_success = True
+        # State and attributes of each sensor, built once per published data
+        self._sensor_states: dict[str, tuple[Any, dict[str, Any] | None]] = {}
+        self._sensor_states_data: StreamSnapshot | None = None
+        self._stream_attribute_limit = stream_attribute_limit
         self._cached_artwork: dict[str, str] = {}
+        self._cached_variants: dict[str, str] = {}
+        # Cache key, URL and variant URLs of each artwork type
+        self._cached_images: dict[str, tuple[str, str, dict[str, str]]] = {}
+        # Last published data and artwork, restored at startup
+        self._snapshot_store = snapshot_store
         self._current_media_hash: str | None = None
-        self._cache_timestamp: int = 0
-
-        # Set up artwork cache directory
-        entity_slug = source_entity_id.replace(".", "_")
-        self._cache_dir = Path(hass.config.path(ARTWORK_CACHE_DIR)) / entity_slug
-        self._local_url_base = f"/local/kodi_streamdetails/{entity_slug}"
+        self._artwork_cache = artwork_cache
+        self._artwork_task: asyncio.Task[None] | None = None
+        # Serializes changes to the artwork of the playing item
+        self._artwork_lock = asyncio.Lock()
+        self._artwork_semaphore = asyncio.Semaphore(ARTWORK_MAX_CONCURRENT_DOWNLOADS)
+        self._artwork_variants = artwork_variants
+        self._artwork_webp = artwork_webp
 
     async def _get_kodi_connection(self) -> Any:
-        """Get the Kodi connection from the config entry's runtime_data."""
+        """Return the client used for Kodi RPC calls."""
         # Return cached connection if available
         if self._kodi is not None:
             return self._kodi
 
+        kodi = await self._async_find_kodi()
+        if self.transport == TRANSPORT_HTTP:
+            if (client := self._async_create_rpc_client()) is not None:
+                self._kodi = client
+                return client
+            self._transport_failures = MAX_TRANSPORT_FAILURES
+        return kodi
+
+    @callback
+    def _async_create_rpc_client(self) -> KodiJsonRpcClient | None:
+        """Create the built-in client from the Kodi config entry's settings."""
+        data = self._kodi_entry_data
+        if CONF_HOST not in data or CONF_PORT not in data:
+            _LOGGER.warning(
+                "Kodi config entry for %s has no HTTP settings, using the Kodi "
+                "integration's connection",
+                self.source_entity_id,
+            )
+            return None
+        return KodiJsonRpcClient(
+            async_get_clientsession(self.hass),
+            data[CONF_HOST],
+            data[CONF_PORT],
+            data.get(CONF_USERNAME),
+            data.get(CONF_PASSWORD),
+            data.get(CONF_SSL, False),
+        )
+
+    async def _async_find_kodi(self) -> Any:
+        """Get the Kodi connection from the config entry's runtime_data."""
+
         # Get the entity from the state machine to verify it exists
         state = self.hass.states.get(self.source_entity_id)
         if state is None:
@@ -94,6 +427,9 @@ class KodiStreamDetailsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if config_entry is None:
             raise UpdateFailed(f"Config entry {source_entry.config_entry_id} not found")
 
+        self._kodi_entry_id = config_entry.entry_id
+        self._kodi_entry_data = dict(config_entry.data)
+
         # Modern HA (2024+): Access runtime_data on the config entry
         runtime_data = getattr(config_entry, "runtime_data", None)
 
@@ -102,6 +438,7 @@ class KodiStreamDetailsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             kodi = getattr(runtime_data, "kodi", None)
             if kodi is not None:
                 self._kodi = kodi
+                self._connection = getattr(runtime_data, "connection", None)
                 _LOGGER.debug("Found Kodi connection via config entry runtime_data")
                 return kodi
 
@@ -111,10 +448,13 @@ class KodiStreamDetailsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if source_entry.config_entry_id in kodi_data:
                 data = kodi_data[source_entry.config_entry_id]
                 kodi = getattr(data, "kodi", None)
+                connection = getattr(data, "connection", None)
                 if kodi is None and isinstance(data, dict):
                     kodi = data.get("kodi")
+                    connection = data.get("connection")
                 if kodi is not None:
                     self._kodi = kodi
+                    self._connection = connection
                     _LOGGER.debug("Found Kodi connection via hass.data")
                     return kodi
 
@@ -123,66 +463,804 @@ class KodiStreamDetailsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "Make sure the Kodi integration is set up and the media player is available."
         )
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def _async_update_data(self) -> StreamSnapshot:
+        """Fetch data from Kodi, sharing fetches that have not asked Kodi yet.
+
+        A refresh requested after the running fetch sent its requests may
+        be about a new item or stream, so it waits for one follow-up fetch,
+        shared by every refresh requested in the meantime.
+        """
+        task = self._refresh_task
+        if task is None or task.done():
+            task = self._async_start_refresh()
+        elif self._refresh_sent:
+            self.fetch_stats["followup_refreshes"] += 1
+            _LOGGER.debug(
+                "Queueing refresh after the one in flight for %s",
+                self.source_entity_id,
+            )
+            task = self._async_start_refresh(task)
+        else:
+            self.fetch_stats["shared_refreshes"] += 1
+            _LOGGER.debug(
+                "Joining refresh already in flight for %s", self.source_entity_id
+            )
+        return await asyncio.shield(task)
+
+    @callback
+    def _async_start_refresh(
+        self, previous: asyncio.Task[StreamSnapshot] | None = None
+    ) -> asyncio.Task[StreamSnapshot]:
+        """Start a fetch, after the previous one when given."""
+        self._refresh_sent = False
+        # Not tracked, so a slow Kodi does not hold up startup
+        self._refresh_task = self.hass.async_create_background_task(
+            self._async_fetch_after(previous),
+            name=f"{DOMAIN} refresh {self.source_entity_id}",
+        )
+        return self._refresh_task
+
+    async def _async_fetch_after(
+        self, previous: asyncio.Task[StreamSnapshot] | None
+    ) -> StreamSnapshot:
+        """Fetch data from Kodi once the previous fetch is done."""
+        if previous is not None:
+            try:
+                # Its own callers handle its result
+                await asyncio.wait((previous,))
+            except asyncio.CancelledError:
+                previous.cancel()
+                raise
+        return await self._async_fetch_data()
+
+    async def _async_fetch_data(self) -> StreamSnapshot:
         """Fetch data from Kodi."""
+        if self._breaker.state == "open":
+            # Kodi is unreachable, do not send anything until the backoff expires
+            self._async_update_interval()
+            raise UpdateFailed(
+                f"Kodi is unreachable, next attempt in {self._breaker.retry_in:.0f}s"
+            )
+
+        # Refreshes requested from now on need a fetch of their own
+        self._refresh_sent = True
         try:
             kodi = await self._get_kodi_connection()
+            if self._breaker.state == "half_open":
+                # Cheap liveness probe before resuming full polls
+                await self._async_timed_call(kodi, "JSONRPC.Ping")
+                _LOGGER.debug("Kodi %s is reachable again", self.source_entity_id)
+            self._async_update_push_subscription()
 
-            # Get active players
-            players = await kodi.call_method("Player.GetActivePlayers")
+            players, item_result, props = await self._async_fetch_player_data(kodi)
+
+            if self._scheduler is not None:
+                item = item_result.get("item", {})
+                self._scheduler.update(
+                    bool(players) and not self._source_idle(),
+                    (item.get("type"), item.get("id"), item.get("label")),
+                )
 
             if not players:
-                # Clear artwork cache when nothing is playing
-                if self._current_media_hash:
-                    await self._clear_cache()
-                    self._current_media_hash = None
-                    self._cached_artwork = {}
-                return self._empty_state()
-
-            player_id = players[0]["playerid"]
+                # Forget the artwork when nothing is playing
+                async with self._artwork_lock:
+                    if self._current_media_hash:
+                        await self._async_cancel_artwork_task()
+                        self._artwork_cache.async_pin(self.source_entity_id, set())
+                        self._current_media_hash = None
+                        self._cached_artwork = {}
+                        self._cached_variants = {}
+                        self._cached_images = {}
+                return EMPTY_SNAPSHOT
+
             player_type = players[0].get("type", "video")
 
-            # Get item with stream details and artwork
-            # pykodi uses **kwargs, so pass params as keyword arguments
-            item_result = await kodi.call_method(
-                "Player.GetItem",
-                playerid=player_id,
-                properties=["streamdetails", "art", "thumbnail"],
+            # Process artwork
+            art_dict = self._art_dict(item_result.get("item", {}))
+
+            # Artwork cached so far; downloads run in the background
+            cached_artwork, cached_variants = await self._async_update_artwork(art_dict)
+
+            self._transport_failures = 0
+            self._breaker.record_success()
+            return self._parse_stream_data(
+                item_result, props, player_type, cached_artwork, cached_variants
             )
 
-            # Get current stream selection
-            props = await kodi.call_method(
-                "Player.GetProperties",
-                playerid=player_id,
-                properties=[
-                    "currentaudiostream",
-                    "currentsubtitle",
-                    "subtitleenabled",
-                    "audiostreams",
-                    "subtitles",
-                ],
+        except UpdateFailed:
+            self._kodi = None
+            self._last_player_id = None
+            self._async_reset_item_details()
+            if self._scheduler is not None:
+                self._scheduler.update(False)
+            self._async_note_update_failure()
+            raise
+        except Exception as err:
+            # RPC errors keep the connection, it is only dropped when the
+            # Kodi config entry goes away
+            if isinstance(self._kodi, KodiJsonRpcClient):
+                self._async_note_transport_failure()
+            self._last_player_id = None
+            self._async_reset_item_details()
+            if self._scheduler is not None:
+                self._scheduler.update(False)
+            if self._breaker.failures:
+                _LOGGER.debug("Error fetching Kodi data: %s", err)
+            else:
+                _LOGGER.error("Error fetching Kodi data: %s", err)
+            self._async_note_update_failure()
+            raise UpdateFailed(f"Error fetching Kodi data: {err}") from err
+        finally:
+            self._async_update_interval()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update only the listeners whose data keys changed.
+
+        Listeners registered with a context of data keys (the sensors) are
+        skipped when none of those keys changed since the last notification.
+        Availability changes still notify everyone.
+        """
+        changed = self._async_changed_keys()
+        if changed is None or changed:
+            self._async_schedule_snapshot_save()
+        for update_callback, context in list(self._listeners.values()):
+            if changed is None or context is None or not changed.isdisjoint(context):
+                update_callback()
+
+    async def async_restore_snapshot(self) -> None:
+        """Publish the last saved data so sensors have a state right away.
+
+        The artwork of the snapshot is only reused if all of it is still
+        cached; otherwise the first refresh fetches it again.
+        """
+        if self._snapshot_store is None:
+            return
+        try:
+            stored = await self._snapshot_store.async_load()
+        except Exception as err:
+            _LOGGER.debug("Error loading snapshot for %s: %s", self.source_entity_id, err)
+            return
+        if not isinstance(stored, dict) or not isinstance(stored.get("data"), dict):
+            return
+
+        try:
+            data = StreamSnapshot.from_dict(stored["data"])
+        except (TypeError, ValueError) as err:
+            _LOGGER.debug(
+                "Ignoring malformed snapshot for %s: %s", self.source_entity_id, err
+            )
+            data = EMPTY_SNAPSHOT
+        manifest = stored.get("artwork")
+        images = self._restored_images(manifest) if data is not EMPTY_SNAPSHOT else {}
+        if images and all(
+            self._artwork_cache.async_contains(key) for key, _, _ in images.values()
+        ):
+            self._current_media_hash = manifest.get("media_hash")
+            self._async_set_cached_artwork(images)
+
+        _LOGGER.debug("Restored last snapshot for %s", self.source_entity_id)
+        # Not async_set_updated_data: notifying would save the data just
+        # loaded again, and no entity is listening yet
+        self.data = self._published_data = data
+
+    def _restored_images(
+        self, manifest: Any
+    ) -> dict[str, tuple[str, str, dict[str, str]]]:
+        """Return the well-formed artwork records of a stored manifest."""
+        if not isinstance(manifest, dict) or not isinstance(
+            records := manifest.get("images"), dict
+        ):
+            return {}
+        images: dict[str, tuple[str, str, dict[str, str]]] = {}
+        for art_type, record in records.items():
+            if (
+                isinstance(record, (list, tuple))
+                and len(record) == 3
+                and isinstance(record[0], str)
+                and isinstance(record[1], str)
+                and isinstance(record[2], dict)
+            ):
+                images[art_type] = (record[0], record[1], record[2])
+            else:
+                _LOGGER.debug(
+                    "Skipping malformed %s artwork record for %s",
+                    art_type,
+                    self.source_entity_id,
+                )
+        return images
+
+    @callback
+    def _async_schedule_snapshot_save(self) -> None:
+        """Persist the published data after a short delay."""
+        if (
+            self._snapshot_store is not None
+            and self.data is not None
+            and self.last_update_success
+        ):
+            self._snapshot_store.async_delay_save(
+                self._snapshot_to_save, SNAPSHOT_SAVE_DELAY
             )
 
-            # Process artwork
-            item = item_result.get("item", {})
-            art_dict = item.get("art", {})
+    @callback
+    def _snapshot_to_save(self) -> dict[str, Any]:
+        """Return the snapshot to persist."""
+        return {
+            "data": dict(self.data),
+            "artwork": {
+                "media_hash": self._current_media_hash,
+                "images": self._cached_images,
+            },
+        }
 
-            # Add thumbnail to art dict if present
-            if item.get("thumbnail"):
-                art_dict["thumbnail"] = item["thumbnail"]
+    @callback
+    def _async_changed_keys(self) -> set[str] | None:
+        """Return the data keys changed since the last notification, None for all."""
+        previous, self._published_data = self._published_data, self.data
+        previous_success = self._published_success
+        self._published_success = self.last_update_success
+        if (
+            previous is None
+            or self.data is None
+            or previous_success != self.last_update_success
+        ):
+            return None
+        return self.data.changed_keys(previous)
+
+    @callback
+    def sensor_state(self, sensor_type: str) -> tuple[Any, dict[str, Any] | None]:
+        """Return the state and attributes of a sensor for the current data."""
+        if self.data is None:
+            return "", None
+        if self._sensor_states_data is not self.data:
+            self._sensor_states = {
+                name: build_sensor_state(
+                    name, config, self.data, self._stream_attribute_limit
+                )
+                for name, config in SENSOR_TYPES.items()
+            }
+            self._sensor_states_data = self.data
+        return self._sensor_states[sensor_type]
+
+    @callback
+    def stream_lists(self) -> dict[str, Any]:
+        """Return the full annotated track lists of the playing item."""
+        data = self.data if self.data is not None else EMPTY_SNAPSHOT
+        return {
+            "audio_streams": [dict(stream) for stream in data.audio_streams],
+            "audio_streams_summary": data.audio_streams_summary,
+            "audio_stream_index": data.audio_stream_index,
+            "subtitle_streams": [dict(stream) for stream in data.subtitle_streams],
+            "subtitle_streams_summary": data.subtitle_streams_summary,
+            "subtitle_stream_index": data.subtitle_stream_index,
+        }
 
-            # Cache artwork and get local URLs
-            cached_artwork = await self._cache_artwork(art_dict)
+    @property
+    def artwork_cache(self) -> ArtworkCache:
+        """Return the shared artwork cache."""
+        return self._artwork_cache
+
+    @property
+    def breaker_stats(self) -> dict[str, Any]:
+        """Return the circuit breaker state for diagnostics."""
+        retry_in = self._breaker.retry_in
+        return {
+            "state": self._breaker.state,
+            "failures": self._breaker.failures,
+            "backoff": self._breaker.backoff,
+            "next_attempt_in": round(retry_in, 1) if retry_in is not None else None,
+        }
 
-            return self._parse_stream_data(item_result, props, player_type, cached_artwork)
+    @callback
+    def async_close_breaker(self) -> None:
+        """Resume polling at once, such as when the source comes back."""
+        if self._breaker.state != "closed":
+            _LOGGER.debug("Source of %s is back, closing the breaker", self.source_entity_id)
+            self._breaker.record_success()
+            self._async_update_interval()
+
+    @callback
+    def _async_note_update_failure(self) -> None:
+        """Count a failed update, backing off if Kodi keeps failing."""
+        if self._breaker.record_failure():
+            _LOGGER.warning(
+                "Kodi for %s is unreachable, retrying with backoff from %ss",
+                self.source_entity_id,
+                self._breaker.backoff,
+            )
 
-        except UpdateFailed:
-            self._kodi = None
-            raise
+    @property
+    def transport(self) -> str:
+        """Return the transport used for RPC calls."""
+        if self._transport_failures >= MAX_TRANSPORT_FAILURES:
+            return DEFAULT_TRANSPORT
+        return self._transport
+
+    @property
+    def push_active(self) -> bool:
+        """Return True if Kodi notifications are currently driving updates."""
+        return bool(self._push_handlers)
+
+    @property
+    def effective_interval(self) -> float:
+        """Return the interval, in seconds, until the next scheduled poll."""
+        if (retry_in := self._breaker.retry_in) is not None:
+            return max(retry_in, MIN_POLL_INTERVAL)
+        if self.push_active:
+            return max(self._poll_interval.total_seconds(), PUSH_SAFETY_POLL_INTERVAL)
+        if self._scheduler is not None:
+            return self._scheduler.interval
+        return self._poll_interval.total_seconds()
+
+    def _source_idle(self) -> bool:
+        """Return True if the source media player is off or idle."""
+        state = self.hass.states.get(self.source_entity_id)
+        return state is None or state.state in ADAPTIVE_IDLE_STATES
+
+    @callback
+    def _async_update_interval(self) -> None:
+        """Apply the push safety net or adaptive interval to the schedule."""
+        if self._hub is not None:
+            self._hub.async_reschedule(self)
+            return
+        self.update_interval = timedelta(seconds=self.effective_interval)
+
+    @callback
+    def _async_update_push_subscription(self) -> None:
+        """Subscribe to Kodi notifications, re-installing handlers if needed.
+
+        The Kodi media player registers its own handlers every time its
+        websocket (re)connects, replacing ours, so this runs on every update.
+        """
+        if not self._push_updates:
+            return
+
+        connection = self._connection
+        if (
+            connection is None
+            or not getattr(connection, "can_subscribe", False)
+            or not connection.connected
+        ):
+            # HTTP-only connection or websocket down: fall back to polling
+            self._async_remove_push_subscription()
+            return
+
+        server = connection.server
+        handlers = getattr(server, "_server_request_handlers", None)
+        if not isinstance(handlers, dict):
+            _LOGGER.debug("Kodi connection does not expose notification handlers")
+            return
+
+        if server is not self._push_server:
+            self._async_remove_push_subscription()
+            self._push_server = server
+
+        for method in PUSH_NOTIFICATIONS:
+            installed = self._push_handlers.get(method)
+            if installed is not None and handlers.get(method) is installed:
+                continue
+            original = handlers.get(method)
+            handler = self._make_push_handler(method, original)
+            handlers[method] = handler
+            self._push_handlers[method] = handler
+            self._push_originals[method] = original
+            _LOGGER.debug("Subscribed to Kodi %s notifications", method)
+
+    @callback
+    def _async_remove_push_subscription(self) -> None:
+        """Restore the notification handlers we replaced."""
+        server = self._push_server
+        handlers = getattr(server, "_server_request_handlers", None)
+        if isinstance(handlers, dict):
+            for method, handler in self._push_handlers.items():
+                if handlers.get(method) is not handler:
+                    continue
+                original = self._push_originals.get(method)
+                if original is None:
+                    handlers.pop(method, None)
+                else:
+                    handlers[method] = original
+        self._push_server = None
+        self._push_handlers = {}
+        self._push_originals = {}
+
+    def _make_push_handler(
+        self, method: str, original: Callable[..., Any] | None
+    ) -> Callable[..., Any]:
+        """Build a notification handler that chains to the original one."""
+
+        async def _handler(*args: Any, **kwargs: Any) -> None:
+            if original is not None:
+                result = original(*args, **kwargs)
+                if inspect.isawaitable(result):
+                    await result
+            self._async_handle_push(method)
+
+        return _handler
+
+    @callback
+    def _async_handle_push(self, method: str) -> None:
+        """Refresh when Kodi reports a player change."""
+        if method == "Player.OnAVChange":
+            # Streams were added or removed, so the track lists are stale
+            self._stream_generation += 1
+        _LOGGER.debug("Kodi sent %s, triggering refresh", method)
+        self.hass.async_create_task(self.async_request_refresh())
+
+    async def _async_timed_call(
+        self, kodi: Any, method: str, **params: Any
+    ) -> tuple[Any, float]:
+        """Call a Kodi method and return its result and duration."""
+        return await self._async_timed(partial(kodi.call_method, method, **params))
+
+    async def _async_timed(self, call: Callable[[], Awaitable[Any]]) -> tuple[Any, float]:
+        """Await a Kodi request and return its result and duration."""
+        if self._rpc_semaphore is None:
+            start = time.monotonic()
+            result = await call()
+            return result, time.monotonic() - start
+        async with self._rpc_semaphore:
+            start = time.monotonic()
+            result = await call()
+            return result, time.monotonic() - start
+
+    async def _async_call_many(
+        self, kodi: Any, calls: list[tuple[str, dict[str, Any]]], concurrent: bool
+    ) -> tuple[list[Any], float]:
+        """Run Kodi calls, pipelined or one by one.
+
+        Returns the results and the summed duration of the individual calls,
+        which is what awaiting them sequentially would have cost. The
+        built-in client pipelines the calls as one JSON-RPC batch, whose
+        duration is returned as is.
+        """
+        if concurrent and isinstance(kodi, KodiJsonRpcClient):
+            return await self._async_timed(partial(kodi.call_batch, calls))
+        if concurrent:
+            timed = await asyncio.gather(
+                *(self._async_timed_call(kodi, method, **params) for method, params in calls)
+            )
+        else:
+            timed = [
+                await self._async_timed_call(kodi, method, **params)
+                for method, params in calls
+            ]
+        return [result for result, _ in timed], sum(duration for _, duration in timed)
+
+    async def _async_call_pipelined(
+        self, kodi: Any, calls: list[tuple[str, dict[str, Any]]], pipelined: bool
+    ) -> tuple[list[Any], float, bool]:
+        """Run Kodi calls pipelined if asked, one by one if that fails.
+
+        Returns the results, their duration and whether they were pipelined.
+        A failed pipeline only counts against pipelining when the same calls
+        then succeed one by one, so an unreachable Kodi does not disable it.
+        """
+        pipeline_error: Exception | None = None
+        if pipelined:
+            try:
+                results, duration = await self._async_call_many(
+                    kodi, calls, concurrent=True
+                )
+            except Exception as err:
+                pipeline_error = err
+            else:
+                return results, duration, True
+        results, duration = await self._async_call_many(kodi, calls, concurrent=False)
+        if pipeline_error is not None:
+            self._async_note_pipeline_failure(pipeline_error)
+        return results, duration, False
+
+    async def _async_fetch_player_data(
+        self, kodi: Any
+    ) -> tuple[list[dict[str, Any]], dict[str, Any], dict[str, Any]]:
+        """Fetch active players, the playing item and stream selection.
+
+        Every poll fetches the current track selection and a cheap identity
+        of the playing item. Stream details, artwork and the full track
+        lists are only fetched again when that identity changes.
+
+        When the player id is known from the previous poll the calls are
+        pipelined over the connection instead of awaited one by one, falling
+        back to sequential calls if the guess was wrong or the connection
+        does not cope with concurrent requests.
+        """
+        start = time.monotonic()
+        call_time = 0.0
+        concurrent = False
+        players: list[dict[str, Any]] | None = None
+        pipeline_error: Exception | None = None
+        player_id = self._last_player_id
+
+        if self._pipelining and player_id is not None:
+            try:
+                (players, item_result, selection), call_time = await self._async_call_many(
+                    kodi,
+                    [
+                        ("Player.GetActivePlayers", {}),
+                        (
+                            "Player.GetItem",
+                            {"playerid": player_id, "properties": ITEM_IDENTITY_PROPERTIES},
+                        ),
+                        (
+                            "Player.GetProperties",
+                            {"playerid": player_id, "properties": SELECTION_PROPERTIES},
+                        ),
+                    ],
+                    concurrent=True,
+                )
+                concurrent = True
+            except Exception as err:
+                pipeline_error = err
+                players = None
+            else:
+                if players and players[0]["playerid"] != player_id:
+                    # Guessed the wrong player, redo the item calls below
+                    players = None
+
+        if players is None:
+            # Sequential path: first poll, player changed or pipeline failed
+            players, duration = await self._async_timed_call(
+                kodi, "Player.GetActivePlayers"
+            )
+            call_time += duration
+            if players:
+                if pipeline_error is not None and players[0]["playerid"] == player_id:
+                    self._async_note_pipeline_failure(pipeline_error)
+                player_id = players[0]["playerid"]
+                # pykodi uses **kwargs, so pass params as keyword arguments
+                (
+                    (item_result, selection),
+                    duration,
+                    pipelined,
+                ) = await self._async_call_pipelined(
+                    kodi,
+                    [
+                        (
+                            "Player.GetItem",
+                            {"playerid": player_id, "properties": ITEM_IDENTITY_PROPERTIES},
+                        ),
+                        (
+                            "Player.GetProperties",
+                            {"playerid": player_id, "properties": SELECTION_PROPERTIES},
+                        ),
+                    ],
+                    # The pipeline already failed once this poll
+                    pipelined=self._pipelining and pipeline_error is None,
+                )
+                call_time += duration
+                concurrent = concurrent or pipelined
+        elif pipeline_error is None:
+            self._pipeline_failures = 0
+
+        if not players:
+            self._last_player_id = None
+            self._async_reset_item_details()
+            self._record_fetch_stats("sequential", "selection", start, call_time)
+            return [], {}, {}
+
+        self._last_player_id = player_id
+        tier = "selection"
+        item = item_result.get("item", {})
+        identity = (
+            player_id,
+            item.get("type"),
+            item.get("id"),
+            item.get("file"),
+            item.get("label"),
+        )
+
+        new_item = identity != self._item_identity
+        if self._needs_full_fetch(identity, players[0]):
+            tier = "full"
+            # Changes reported while this fetch runs need another one
+            generation = self._stream_generation
+            prefetched = self._async_take_prefetched_item(item) if new_item else None
+            if prefetched is not None:
+                # The item details are already known, only the track lists
+                # depend on the player
+                tier = "prefetched"
+                stream_lists, duration = await self._async_timed_call(
+                    kodi,
+                    "Player.GetProperties",
+                    playerid=player_id,
+                    properties=STREAM_LIST_PROPERTIES,
+                )
+                item_details = {"item": prefetched}
+            else:
+                (
+                    (item_details, stream_lists),
+                    duration,
+                    pipelined,
+                ) = await self._async_call_pipelined(
+                    kodi,
+                    [
+                        (
+                            "Player.GetItem",
+                            {"playerid": player_id, "properties": ITEM_PROPERTIES},
+                        ),
+                        (
+                            "Player.GetProperties",
+                            {"playerid": player_id, "properties": STREAM_LIST_PROPERTIES},
+                        ),
+                    ],
+                    pipelined=self._pipelining and pipeline_error is None,
+                )
+                concurrent = concurrent or pipelined
+            call_time += duration
+            if new_item:
+                self._async_start_prefetch(kodi, player_id)
+            self._item_identity = identity
+            self._item_details = item_details
+            self._stream_lists = stream_lists
+            self._fetched_generation = generation
+
+        self._record_fetch_stats(
+            "pipelined" if concurrent else "sequential", tier, start, call_time
+        )
+        return players, self._item_details, {**self._stream_lists, **selection}
+
+    @callback
+    def _async_take_prefetched_item(self, item: dict[str, Any]) -> dict[str, Any] | None:
+        """Return the prefetched details if they are for the given item."""
+        prefetched, self._prefetched_item = self._prefetched_item, None
+        if (
+            prefetched is not None
+            and item.get("file")
+            and prefetched.get("file") == item.get("file")
+            and prefetched.get("type") == item.get("type")
+        ):
+            _LOGGER.debug("Using prefetched details for %s", item.get("label"))
+            return prefetched
+        return None
+
+    @callback
+    def _async_start_prefetch(self, kodi: Any, player_id: int) -> None:
+        """Prefetch the next playlist item in the background."""
+        if self._prefetch_task is not None and not self._prefetch_task.done():
+            self._prefetch_task.cancel()
+        self._prefetch_task = self.hass.async_create_background_task(
+            self._async_prefetch_next_item(kodi, player_id),
+            name=f"{DOMAIN} prefetch {self.source_entity_id}",
+        )
+
+    async def _async_prefetch_next_item(self, kodi: Any, player_id: int) -> None:
+        """Fetch the next playlist item's details and warm its artwork."""
+        try:
+            position, _ = await self._async_timed_call(
+                kodi,
+                "Player.GetProperties",
+                playerid=player_id,
+                properties=PLAYLIST_POSITION_PROPERTIES,
+            )
+            playlist_id = position.get("playlistid", -1)
+            current = position.get("position", -1)
+            if playlist_id < 0 or current < 0:
+                return
+            result, _ = await self._async_timed_call(
+                kodi,
+                "Playlist.GetItems",
+                playlistid=playlist_id,
+                properties=ITEM_PROPERTIES,
+                limits={"start": current + 1, "end": current + 2},
+            )
         except Exception as err:
+            _LOGGER.debug("Error prefetching the next playlist item: %s", err)
+            return
+
+        items = result.get("items") or []
+        if not items or not items[0].get("file"):
+            return
+        item = items[0]
+        self._prefetched_item = item
+        self.fetch_stats["prefetches"] += 1
+        _LOGGER.debug("Prefetched next playlist item %s", item.get("label"))
+
+        # Warm the artwork cache so the transition can publish it at once
+        art_dict = self._art_dict(item)
+        art_types = [art_type for art_type in art_dict if art_type in ARTWORK_TO_CACHE]
+        session = async_get_clientsession(self.hass)
+        await asyncio.gather(
+            *(
+                self._async_fetch_artwork(session, art_type, art_dict[art_type])
+                for art_type in art_types
+            )
+        )
+
+    def _needs_full_fetch(self, identity: tuple[Any, ...], player: dict[str, Any]) -> bool:
+        """Return True if stream details and track lists must be refetched."""
+        if identity != self._item_identity:
+            self._full_fetch_retries = 0
+            return True
+        if self._fetched_generation != self._stream_generation:
+            return True
+        # Kodi can report the new item before its stream details are known
+        video = self._item_details.get("item", {}).get("streamdetails", {}).get("video")
+        if (
+            not video
+            and player.get("type", "video") == "video"
+            and self._full_fetch_retries < MAX_FULL_FETCH_RETRIES
+        ):
+            self._full_fetch_retries += 1
+            return True
+        return False
+
+    @callback
+    def _async_reset_item_details(self) -> None:
+        """Forget the cached details of the playing item."""
+        self._item_identity = None
+        self._item_details = {}
+        self._stream_lists = {}
+        self._full_fetch_retries = 0
+
+    @callback
+    def _async_note_transport_failure(self) -> None:
+        """Count a failed update over the built-in client, falling back if it keeps failing."""
+        self._transport_failures += 1
+        if self._transport_failures == MAX_TRANSPORT_FAILURES:
+            _LOGGER.warning(
+                "Built-in JSON-RPC client for %s keeps failing, "
+                "using the Kodi integration's connection",
+                self.source_entity_id,
+            )
             self._kodi = None
-            _LOGGER.error("Error fetching Kodi data: %s", err)
-            raise UpdateFailed(f"Error fetching Kodi data: {err}") from err
+
+    @callback
+    def _async_kodi_entry_changed(
+        self, change: ConfigEntryChange, entry: ConfigEntry
+    ) -> None:
+        """Drop the cached connection when its Kodi config entry goes away."""
+        if entry.entry_id != self._kodi_entry_id:
+            return
+        if (
+            change is not ConfigEntryChange.REMOVED
+            and entry.state is ConfigEntryState.LOADED
+            and entry.data == self._kodi_entry_data
+        ):
+            return
+        _LOGGER.debug(
+            "Kodi config entry for %s changed, resolving the connection again",
+            self.source_entity_id,
+        )
+        self._async_remove_push_subscription()
+        self._kodi = None
+        self._connection = None
+        self._kodi_entry_id = None
+
+    @callback
+    def _async_note_pipeline_failure(self, err: Exception) -> None:
+        """Count a failed pipelined poll, giving up on pipelining if it keeps failing."""
+        self._pipeline_failures += 1
+        _LOGGER.debug("Pipelined Kodi poll failed: %s", err)
+        if self._pipeline_failures >= MAX_PIPELINE_FAILURES:
+            _LOGGER.debug("Disabling pipelined polling for %s", self.source_entity_id)
+            self._pipelining = False
+
+    def _record_fetch_stats(
+        self, mode: str, tier: str, start: float, call_time: float
+    ) -> None:
+        """Record how long a poll took and how much pipelining saved.
+
+        A JSON-RPC batch is timed as a whole, so polls sent as one batch by
+        the built-in client report next to nothing saved.
+        """
+        duration = time.monotonic() - start
+        saved = max(call_time - duration, 0.0)
+        stats = self.fetch_stats
+        stats["mode"] = mode
+        stats["tier"] = tier
+        stats["duration"] = round(duration, 4)
+        stats["sequential_duration"] = round(call_time, 4)
+        stats["saved"] = round(saved, 4)
+        stats["total_saved"] = round(stats["total_saved"] + saved, 4)
+        stats[f"{tier}_polls"] += 1
+        if mode == "pipelined":
+            stats["pipelined_polls"] += 1
+            _LOGGER.debug(
+                "Pipelined Kodi poll took %.3fs, %.3fs faster than sequential calls",
+                duration,
+                saved,
+            )
 
     def _parse_stream_data(
         self,
@@ -190,7 +1268,8 @@ class KodiStreamDetailsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         props: dict[str, Any],
         player_type: str,
         cached_artwork: dict[str, str],
-    ) -> dict[str, Any]:
+        cached_variants: dict[str, str],
+    ) -> StreamSnapshot:
         """Parse and normalize stream details."""
         item = item_result.get("item", {})
         streamdetails = item.get("streamdetails", {})
@@ -200,181 +1279,130 @@ class KodiStreamDetailsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         video = video_streams[0] if video_streams else {}
 
         # Audio/subtitles from Player.GetProperties (richer data, Atmos detection)
-        audio_streams = props.get("audiostreams", [])
-        subtitle_streams = props.get("subtitles", [])
-        current_audio = props.get("currentaudiostream", {})
-        current_subtitle = props.get("currentsubtitle", {})
+        audio_streams, audio_streams_summary = self._annotated_streams(
+            "audio",
+            props.get("audiostreams", []),
+            annotate_audio_stream,
+            summarize_audio_streams,
+        )
+        subtitle_streams, subtitle_streams_summary = self._annotated_streams(
+            "subtitle",
+            props.get("subtitles", []),
+            annotate_subtitle_stream,
+            summarize_subtitle_streams,
+        )
+        current_audio = props.get("currentaudiostream") or {}
+        current_subtitle = props.get("currentsubtitle") or {}
         subtitle_enabled = props.get("subtitleenabled", False)
+        # Subtitle track shown on screen, if any
+        shown_subtitle = current_subtitle if subtitle_enabled else {}
 
         # Normalize values
         video_codec_raw = video.get("codec", "")
-        video_codec = self._normalize_video_codec(video_codec_raw)
+        video_codec, video_codec_display = normalize_video_codec(video_codec_raw)
         video_width = video.get("width", 0)
         video_height = video.get("height", 0)
         video_aspect_raw = video.get("aspect", 0)
         video_hdr_raw = video.get("hdrtype", "")
+        video_hdr_type, video_hdr_type_display = normalize_hdr_type(video_hdr_raw)
         video_duration = video.get("duration", 0)
 
-        audio_codec_raw = current_audio.get("codec", "") if current_audio else ""
-        audio_codec = self._normalize_audio_codec(audio_codec_raw)
-        audio_channels_raw = current_audio.get("channels", 0) if current_audio else 0
-        audio_language = current_audio.get("language", "") if current_audio else ""
+        audio_codec_raw = current_audio.get("codec", "")
+        audio_codec, audio_codec_display = normalize_audio_codec(audio_codec_raw)
+        audio_channels_raw = current_audio.get("channels", 0)
+        audio_language = current_audio.get("language", "")
+        audio_bitrate = current_audio.get("bitrate", 0)
 
-        subtitle_language = current_subtitle.get("language", "") if subtitle_enabled and current_subtitle else "off"
+        subtitle_language = shown_subtitle.get("language", "") if shown_subtitle else "off"
 
         # Determine playback type
         playback_type = item.get("type", "")
         if not playback_type and player_type == "audio":
             playback_type = "song"
 
-        return {
+        return StreamSnapshot(
             # Video (from streamdetails)
-            "video_codec": video_codec,
-            "video_codec_raw": video_codec_raw,
-            "video_codec_display": VIDEO_CODEC_DISPLAY.get(video_codec),
-            "video_width": video_width if video_width else None,
-            "video_height": video_height if video_height else None,
-            "video_resolution": self._derive_resolution(video_width),
-            "video_aspect": self._format_aspect(video_aspect_raw),
-            "video_aspect_raw": video_aspect_raw if video_aspect_raw else None,
-            "video_hdr_type": HDR_TYPE_MAP.get(video_hdr_raw, video_hdr_raw or "sdr"),
-            "video_hdr_type_raw": video_hdr_raw,
-            "video_hdr_type_display": HDR_TYPE_DISPLAY.get(
-                HDR_TYPE_MAP.get(video_hdr_raw, "sdr"), "SDR"
-            ),
-            "video_stereo_mode": video.get("stereomode", "") or "2d",
-            "video_duration": video_duration if video_duration else None,
-            "video_duration_formatted": self._format_duration(video_duration),
+            video_codec=video_codec,
+            video_codec_raw=video_codec_raw,
+            video_codec_display=video_codec_display,
+            video_width=video_width or None,
+            video_height=video_height or None,
+            video_resolution=derive_resolution(video_width, video_height),
+            video_aspect=format_aspect(video_aspect_raw),
+            video_aspect_raw=video_aspect_raw or None,
+            video_hdr_type=video_hdr_type,
+            video_hdr_type_raw=video_hdr_raw,
+            video_hdr_type_display=video_hdr_type_display,
+            video_stereo_mode=video.get("stereomode", "") or "2d",
+            video_duration=video_duration or None,
+            video_duration_formatted=self._format_duration(video_duration),
             # Audio (from Player.GetProperties - includes Atmos detection)
-            "audio_codec": audio_codec,
-            "audio_codec_raw": audio_codec_raw,
-            "audio_codec_display": AUDIO_CODEC_DISPLAY.get(audio_codec),
-            "audio_channels": self._format_channels(audio_channels_raw),
-            "audio_channels_raw": audio_channels_raw if audio_channels_raw else None,
-            "audio_language": audio_language if audio_language else None,
-            "audio_language_name": LANGUAGE_NAMES.get(audio_language),
-            "audio_name": current_audio.get("name", "") if current_audio else None,
-            "audio_bitrate": current_audio.get("bitrate", 0) if current_audio else None,
-            "audio_bitrate_formatted": self._format_bitrate(current_audio.get("bitrate", 0) if current_audio else 0),
-            "audio_stream_index": current_audio.get("index", 0) if current_audio else None,
-            "audio_stream_count": len(audio_streams),
-            "audio_streams": audio_streams,
-            "audio_is_default": "on" if current_audio and current_audio.get("isdefault", False) else "off",
-            "audio_is_original": "on" if current_audio and current_audio.get("isoriginal", False) else "off",
+            audio_codec=audio_codec,
+            audio_codec_raw=audio_codec_raw,
+            audio_codec_display=audio_codec_display,
+            audio_channels=format_channels(audio_channels_raw),
+            audio_channels_raw=audio_channels_raw or None,
+            audio_language=audio_language or None,
+            audio_language_name=LANGUAGE_NAMES.get(audio_language),
+            audio_name=current_audio.get("name", "") if current_audio else None,
+            audio_bitrate=audio_bitrate if current_audio else None,
+            audio_bitrate_formatted=self._format_bitrate(audio_bitrate),
+            audio_stream_index=current_audio.get("index", 0) if current_audio else None,
+            audio_stream_count=len(audio_streams),
+            audio_streams=audio_streams,
+            audio_streams_summary=audio_streams_summary,
+            audio_is_default="on" if current_audio.get("isdefault", False) else "off",
+            audio_is_original="on" if current_audio.get("isoriginal", False) else "off",
             # Subtitles (from Player.GetProperties - includes track names)
-            "subtitle_enabled": "on" if subtitle_enabled else "off",
-            "subtitle_language": subtitle_language if subtitle_language else None,
-            "subtitle_language_name": LANGUAGE_NAMES.get(subtitle_language) if subtitle_enabled else None,
-            "subtitle_name": current_subtitle.get("name", "") if subtitle_enabled and current_subtitle else None,
-            "subtitle_stream_index": current_subtitle.get("index", 0) if subtitle_enabled and current_subtitle else None,
-            "subtitle_stream_count": len(subtitle_streams),
-            "subtitle_streams": subtitle_streams,
-            "subtitle_is_forced": "on" if current_subtitle and current_subtitle.get("isforced", False) else "off",
-            "subtitle_is_impaired": "on" if current_subtitle and current_subtitle.get("isimpaired", False) else "off",
+            subtitle_enabled="on" if subtitle_enabled else "off",
+            subtitle_language=subtitle_language or None,
+            subtitle_language_name=(
+                LANGUAGE_NAMES.get(subtitle_language) if subtitle_enabled else None
+            ),
+            subtitle_name=shown_subtitle.get("name", "") if shown_subtitle else None,
+            subtitle_stream_index=(
+                shown_subtitle.get("index", 0) if shown_subtitle else None
+            ),
+            subtitle_stream_count=len(subtitle_streams),
+            subtitle_streams=subtitle_streams,
+            subtitle_streams_summary=subtitle_streams_summary,
+            subtitle_is_forced="on" if current_subtitle.get("isforced", False) else "off",
+            subtitle_is_impaired=(
+                "on" if current_subtitle.get("isimpaired", False) else "off"
+            ),
             # Playback
-            "playback_type": playback_type,
+            playback_type=playback_type,
             # Artwork
-            "artwork": cached_artwork,
-            "artwork_count": len(cached_artwork),
-        }
-
-    def _empty_state(self) -> dict[str, Any]:
-        """Return empty state when nothing is playing."""
-        return {
-            "video_codec": None,
-            "video_codec_raw": None,
-            "video_codec_display": None,
-            "video_width": None,
-            "video_height": None,
-            "video_resolution": None,
-            "video_aspect": None,
-            "video_aspect_raw": None,
-            "video_hdr_type": None,
-            "video_hdr_type_raw": None,
-            "video_hdr_type_display": None,
-            "video_stereo_mode": None,
-            "video_duration": None,
-            "video_duration_formatted": None,
-            "audio_codec": None,
-            "audio_codec_raw": None,
-            "audio_codec_display": None,
-            "audio_channels": None,
-            "audio_channels_raw": None,
-            "audio_language": None,
-            "audio_language_name": None,
-            "audio_name": None,
-            "audio_bitrate": None,
-            "audio_bitrate_formatted": None,
-            "audio_stream_index": None,
-            "audio_stream_count": 0,
-            "audio_streams": [],
-            "audio_is_default": "off",
-            "audio_is_original": "off",
-            "subtitle_enabled": "off",
-            "subtitle_language": "off",
-            "subtitle_language_name": None,
-            "subtitle_name": None,
-            "subtitle_stream_index": None,
-            "subtitle_stream_count": 0,
-            "subtitle_streams": [],
-            "subtitle_is_forced": "off",
-            "subtitle_is_impaired": "off",
-            "playback_type": "",
-            "artwork": {},
-            "artwork_count": 0,
-        }
-
-    def _normalize_video_codec(self, codec: str) -> str | None:
-        """Normalize video codec string."""
-        if not codec:
-            return None
-        codec_lower = codec.lower()
-        return VIDEO_CODEC_MAP.get(codec_lower, codec_lower)
+            artwork=cached_artwork,
+            artwork_variants=cached_variants,
+            artwork_count=len(cached_artwork),
+        )
 
-    def _normalize_audio_codec(self, codec: str) -> str | None:
-        """Normalize audio codec string."""
-        if not codec:
-            return None
-        codec_lower = codec.lower()
-        # Handle PCM variants
-        if codec_lower.startswith("pcm"):
-            return "pcm"
-        return AUDIO_CODEC_MAP.get(codec_lower, codec_lower)
-
-    def _derive_resolution(self, width: int) -> str | None:
-        """Derive resolution label from video width."""
-        if not width:
-            return None
-        for threshold, label in RESOLUTION_THRESHOLDS:
-            if width >= threshold:
-                return label
-        return "SD"
-
-    def _format_aspect(self, aspect: float) -> str | None:
-        """Format aspect ratio to human-readable string."""
-        if not aspect:
-            return None
-        # Check for known aspect ratios (with tolerance)
-        for known_aspect, name in ASPECT_RATIO_NAMES.items():
-            if abs(aspect - known_aspect) < 0.05:
-                return name
-        # Format as X.XX:1
-        return f"{aspect:.2f}:1"
-
-    def _format_channels(self, channels: int) -> str | None:
-        """Format channel count to standard notation."""
-        if not channels:
-            return None
-        # Standard channel layouts
-        channel_map = {
-            1: "1.0",
-            2: "2.0",
-            3: "2.1",
-            6: "5.1",
-            7: "6.1",
-            8: "7.1",
-        }
-        return channel_map.get(channels, f"{channels}.0")
+    def _annotated_streams(
+        self,
+        kind: str,
+        streams: list[dict[str, Any]],
+        annotate: Callable[[dict[str, Any]], dict[str, Any]],
+        summarize: Callable[[tuple[ReadOnlyDict, ...]], str],
+    ) -> tuple[tuple[ReadOnlyDict, ...], str | None]:
+        """Return the annotated tracks of a stream list and their summary.
+
+        Tracks are annotated once per list: the same list, or one with the
+        same digest on a later poll, returns the same immutable tuple.
+        """
+        if not streams:
+            return (), None
+        cached = self._stream_annotations.get(kind)
+        if cached is not None and cached[0] is streams:
+            return cached[2], cached[3]
+        digest = hashlib.blake2b(repr(streams).encode(), digest_size=16).digest()
+        if cached is not None and cached[1] == digest:
+            annotated, summary = cached[2], cached[3]
+        else:
+            annotated = tuple(ReadOnlyDict(annotate(stream)) for stream in streams)
+            summary = summarize(annotated)
+        self._stream_annotations[kind] = (streams, digest, annotated, summary)
+        return annotated, summary
 
     def _format_duration(self, seconds: int) -> str | None:
         """Format duration in seconds to HH:MM:SS."""
@@ -414,98 +1442,264 @@ class KodiStreamDetailsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         return kodi_url
 
-    def _sync_ensure_cache_dir(self) -> None:
-        """Create cache directory if needed (sync, run in executor)."""
-        self._cache_dir.mkdir(parents=True, exist_ok=True)
-
-    def _sync_clear_cache_dir(self) -> None:
-        """Remove all files from cache directory (sync, run in executor)."""
-        if self._cache_dir.exists():
-            for file in self._cache_dir.iterdir():
-                if file.is_file():
-                    file.unlink()
+    async def _async_update_artwork(
+        self, art_dict: dict[str, str]
+    ) -> tuple[dict[str, str], dict[str, str]]:
+        """Return the artwork and variant URLs cached so far, downloading new artwork.
 
-    async def _cache_artwork(self, art_dict: dict[str, str]) -> dict[str, str]:
-        """Download and cache artwork locally, return local URLs."""
+        Downloads run in a background task so stream details are published
+        without waiting on slow image mirrors. The task triggers a follow-up
+        update when the artwork is ready and is cancelled if the media
+        changes again in the meantime.
+        """
         if not art_dict:
-            return {}
+            return {}, {}
 
         # Create a hash of all artwork URLs to detect media changes
         art_hash = hashlib.md5(str(sorted(art_dict.items())).encode()).hexdigest()[:12]
 
-        # If media changed, clear old cache
-        if art_hash != self._current_media_hash:
-            await self._clear_cache()
-            self._current_media_hash = art_hash
-            self._cache_timestamp = int(time.time())
-            self._cached_artwork = {}
-
-        # Return cached URLs if already processed
-        if self._cached_artwork:
-            return self._cached_artwork
-
-        # Ensure cache directory exists
-        await self.hass.async_add_executor_job(self._sync_ensure_cache_dir)
-
-        cached_urls: dict[str, str] = {}
+        async with self._artwork_lock:
+            if art_hash != self._current_media_hash:
+                await self._async_cancel_artwork_task()
+                self._current_media_hash = art_hash
+                self._cached_artwork = {}
+                self._cached_variants = {}
+                self._cached_images = {}
+                if self._async_use_warm_artwork(art_dict):
+                    return self._cached_artwork, self._cached_variants
+            elif self._cached_artwork or (
+                self._artwork_task is not None and not self._artwork_task.done()
+            ):
+                return self._cached_artwork, self._cached_variants
+
+            self._artwork_task = self.hass.async_create_background_task(
+                self._async_cache_artwork(art_hash, art_dict),
+                name=f"{DOMAIN} artwork {self.source_entity_id}",
+            )
+            return self._cached_artwork, self._cached_variants
 
-        session = async_get_clientsession(self.hass)
+    @callback
+    def _async_use_warm_artwork(self, art_dict: dict[str, str]) -> bool:
+        """Use cached artwork without downloading if all of it is ready."""
+        cached: dict[str, tuple[str, str, dict[str, str]]] = {}
         for art_type, kodi_url in art_dict.items():
-            # Only cache essential artwork types
             if art_type not in ARTWORK_TO_CACHE:
                 continue
+            if (url := self._artwork_source_url(kodi_url)) is None:
+                continue
+            result = self._artwork_cache.async_lookup(
+                url, self._artwork_variants, self._artwork_webp
+            )
+            if result is None:
+                return False
+            cached[art_type] = result
+        if not cached:
+            return False
+        self._async_set_cached_artwork(cached)
+        return True
+
+    async def _async_cancel_artwork_task(self) -> None:
+        """Cancel a running artwork download and wait for it to stop."""
+        task, self._artwork_task = self._artwork_task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    async def _async_cache_artwork(self, art_hash: str, art_dict: dict[str, str]) -> None:
+        """Fetch artwork into the shared cache, then publish the local URLs."""
+        # Only cache essential artwork types
+        art_types = [art_type for art_type in art_dict if art_type in ARTWORK_TO_CACHE]
+        session = async_get_clientsession(self.hass)
+        results = await asyncio.gather(
+            *(
+                self._async_fetch_artwork(session, art_type, art_dict[art_type])
+                for art_type in art_types
+            )
+        )
+        cached = {
+            art_type: result for art_type, result in zip(art_types, results) if result
+        }
 
-            try:
-                # Decode the Kodi URL
-                actual_url = self._decode_kodi_image_url(kodi_url)
-                if not actual_url:
-                    continue
-
-                # Skip non-http URLs (local files, etc.)
-                if not actual_url.startswith(("http://", "https://")):
-                    _LOGGER.debug("Skipping non-HTTP artwork URL: %s", actual_url)
-                    continue
+        async with self._artwork_lock:
+            if art_hash != self._current_media_hash:
+                return
+            self._async_set_cached_artwork(cached)
 
-                # Generate filename based on art type
-                # Sanitize art_type for filename (replace dots with underscores)
-                safe_art_type = art_type.replace(".", "_").replace("/", "_")
-
-                # Get file extension from URL or default to jpg
-                ext = Path(actual_url.split("?")[0]).suffix or ".jpg"
-                if ext not in (".jpg", ".jpeg", ".png", ".webp", ".gif"):
-                    ext = ".jpg"
-
-                filename = f"{safe_art_type}{ext}"
-                filepath = self._cache_dir / filename
-
-                # Download the image
-                async with session.get(actual_url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                    if response.status == 200:
-                        content = await response.read()
-                        await self.hass.async_add_executor_job(filepath.write_bytes, content)
-                        # Add cache-busting query param to prevent browser caching
-                        cached_urls[art_type] = f"{self._local_url_base}/{filename}?t={self._cache_timestamp}"
-                        _LOGGER.debug("Cached artwork %s to %s", art_type, filepath)
-                    else:
-                        _LOGGER.debug("Failed to download %s: HTTP %s", art_type, response.status)
-
-            except aiohttp.ClientError as err:
-                _LOGGER.debug("Error downloading artwork %s: %s", art_type, err)
-            except Exception as err:
-                _LOGGER.debug("Unexpected error caching artwork %s: %s", art_type, err)
+        if self._cached_artwork and self.data is not None and self.last_update_success:
+            # Not async_set_updated_data: that would mark a failed poll as a
+            # success and cancel a requested refresh
+            self.data = self.data.with_artwork(
+                self._cached_artwork, self._cached_variants
+            )
+            self.async_update_listeners()
 
-        self._cached_artwork = cached_urls
-        return cached_urls
+    @callback
+    def _async_set_cached_artwork(
+        self, cached: dict[str, tuple[str, str, dict[str, str]]]
+    ) -> None:
+        """Pin the artwork of the playing item and remember its URLs."""
+        self._cached_images = cached
+        self._artwork_cache.async_pin(
+            self.source_entity_id, {key for key, _, _ in cached.values()}
+        )
+        self._cached_artwork = {
+            art_type: url for art_type, (_, url, _) in cached.items()
+        }
+        self._cached_variants = {
+            f"{art_type}_{name}": url
+            for art_type, (_, _, variant_urls) in cached.items()
+            for name, url in variant_urls.items()
+        }
 
-    async def _clear_cache(self) -> None:
-        """Clear the artwork cache directory."""
+    async def _async_fetch_artwork(
+        self, session: aiohttp.ClientSession, art_type: str, kodi_url: str
+    ) -> tuple[str, str, dict[str, str]] | None:
+        """Fetch one artwork image, return its cache key, local and variant URLs."""
         try:
-            await self.hass.async_add_executor_job(self._sync_clear_cache_dir)
-            _LOGGER.debug("Cleared artwork cache at %s", self._cache_dir)
+            if (actual_url := self._artwork_source_url(kodi_url)) is None:
+                return None
+
+            return await self._artwork_cache.async_fetch(
+                session,
+                actual_url,
+                self._artwork_semaphore,
+                self._artwork_variants,
+                self._artwork_webp,
+            )
+
+        except aiohttp.ClientError as err:
+            _LOGGER.debug("Error downloading artwork %s: %s", art_type, err)
         except Exception as err:
-            _LOGGER.debug("Error clearing cache: %s", err)
+            _LOGGER.debug("Unexpected error caching artwork %s: %s", art_type, err)
+        return None
+
+    def _artwork_source_url(self, kodi_url: str) -> str | None:
+        """Return the HTTP URL of a Kodi image, or None if it is not cacheable."""
+        # Decode the Kodi URL
+        actual_url = self._decode_kodi_image_url(kodi_url)
+        if not actual_url:
+            return None
+
+        # Skip non-http URLs (local files, etc.)
+        if not actual_url.startswith(("http://", "https://")):
+            _LOGGER.debug("Skipping non-HTTP artwork URL: %s", actual_url)
+            return None
+        return actual_url
+
+    @staticmethod
+    def _art_dict(item: dict[str, Any]) -> dict[str, str]:
+        """Return the artwork of a Kodi item, including its thumbnail."""
+        art_dict = dict(item.get("art", {}))
+
+        # Add thumbnail to art dict if present
+        if item.get("thumbnail"):
+            art_dict["thumbnail"] = item["thumbnail"]
+        return art_dict
+
+    async def async_apply_options(self, options: Mapping[str, Any]) -> None:
+        """Apply changed options to the running coordinator.
+
+        Everything but the source entity can change without a reload: the
+        schedule, push updates, transport and artwork settings take effect
+        on the refresh started here. The caller applies hub mode and the
+        artwork budget, which are shared with other players.
+        """
+        poll_interval = options.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL)
+        self._poll_interval = timedelta(seconds=poll_interval)
+        self._async_set_scheduler(
+            (
+                poll_interval,
+                options.get(CONF_POLL_FLOOR, DEFAULT_POLL_FLOOR),
+                options.get(CONF_POLL_CEILING, DEFAULT_POLL_CEILING),
+            )
+            if options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING)
+            else None
+        )
+
+        push_updates = options.get(CONF_PUSH_UPDATES, DEFAULT_PUSH_UPDATES)
+        if push_updates != self._push_updates:
+            self._push_updates = push_updates
+            self._request_debouncer.cooldown = _request_cooldown(push_updates)
+            if not push_updates:
+                self._async_remove_push_subscription()
+
+        self.state_refresh_debouncer.cooldown = options.get(
+            CONF_STATE_DEBOUNCE, DEFAULT_STATE_DEBOUNCE
+        )
+
+        transport = options.get(CONF_TRANSPORT, DEFAULT_TRANSPORT)
+        if transport != self._transport:
+            # Resolve the client again on the next refresh
+            self._transport = transport
+            self._transport_failures = 0
+            self._kodi = None
+
+        artwork = (
+            tuple(options.get(CONF_ARTWORK_VARIANTS, DEFAULT_ARTWORK_VARIANTS)),
+            options.get(CONF_ARTWORK_WEBP, DEFAULT_ARTWORK_WEBP),
+        )
+        if artwork != (self._artwork_variants, self._artwork_webp):
+            self._artwork_variants, self._artwork_webp = artwork
+            # Cache the artwork of the playing item again with the new variants
+            self._current_media_hash = None
+
+        stream_attribute_limit = options.get(
+            CONF_STREAM_ATTRIBUTE_LIMIT, DEFAULT_STREAM_ATTRIBUTE_LIMIT
+        )
+        if stream_attribute_limit != self._stream_attribute_limit:
+            self._stream_attribute_limit = stream_attribute_limit
+            # Rebuild the sensor attributes and write them to every sensor
+            self._sensor_states_data = None
+            super().async_update_listeners()
+
+        self._async_update_interval()
+        await self.async_refresh()
+
+    @callback
+    def async_set_hub(self, hub: KodiStreamDetailsHub | None) -> None:
+        """Hand the poll schedule to a hub, or take it back with None."""
+        if hub is self._hub:
+            return
+        if self._unsub_hub is not None:
+            self._unsub_hub()
+            self._unsub_hub = None
+        self._hub = hub
+        if hub is not None:
+            self._rpc_semaphore = hub.rpc_semaphore
+            # The hub schedules the polls
+            self.update_interval = None
+            self._async_unsub_refresh()
+            self._unsub_hub = hub.async_register(self)
+        else:
+            self._rpc_semaphore = None
+            self._async_update_interval()
+            if self._listeners:
+                self._schedule_refresh()
+
+    @callback
+    def _async_set_scheduler(self, bounds: tuple[int, int, int] | None) -> None:
+        """Enable adaptive polling with (base, floor, ceiling), or disable it."""
+        if bounds == self._scheduler_bounds:
+            return
+        self._scheduler_bounds = bounds
+        self._scheduler = AdaptivePollScheduler(*bounds) if bounds else None
 
     async def async_shutdown(self) -> None:
         """Clean up on shutdown."""
-        await self._clear_cache()
+        if self._unsub_hub is not None:
+            self._unsub_hub()
+            self._unsub_hub = None
+        self.state_refresh_debouncer.async_shutdown()
+        self._unsub_kodi_entry()
+        self._async_remove_push_subscription()
+        await self._async_cancel_artwork_task()
+        for task in (self._prefetch_task, self._refresh_task):
+            if task is not None and not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError, UpdateFailed):
+                    await task
+        self._prefetch_task = self._refresh_task = None
+        self._artwork_cache.async_remove_owner(self.source_entity_id)
         await super().async_shutdown()
@@ -0,0 +1,33 @@
+"""Diagnostics support for Kodi Stream Details."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_HUB_MODE, DOMAIN
+from .coordinator import KodiStreamDetailsCoordinator
+from .hub import DATA_HUB
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: KodiStreamDetailsCoordinator = hass.data[DOMAIN][entry.entry_id]
+    hub = hass.data.get(DATA_HUB) if entry.options.get(CONF_HUB_MODE) else None
+    return {
+        "source_entity": coordinator.source_entity_id,
+        "options": dict(entry.options),
+        "last_update_success": coordinator.last_update_success,
+        "effective_interval": coordinator.effective_interval,
+        "push_active": coordinator.push_active,
+        "transport": coordinator.transport,
+        "breaker": coordinator.breaker_stats,
+        "fetch": dict(coordinator.fetch_stats),
+        "artwork_cache": coordinator.artwork_cache.stats,
+        "hub": hub.stats if hub is not None else None,
+        "data": dict(coordinator.data) if coordinator.data is not None else None,
+    }
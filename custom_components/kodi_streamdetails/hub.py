@@ -0,0 +1,190 @@
+"""Shared poll scheduler for Kodi Stream Details."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DOMAIN, HUB_LATENCY_SMOOTHING, HUB_MAX_RPCS_IN_FLIGHT
+
+if TYPE_CHECKING:
+    from .coordinator import KodiStreamDetailsCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_HUB = f"{DOMAIN}_hub"
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> KodiStreamDetailsHub:
+    """Return the hub shared by all players in hub mode."""
+    if (hub := hass.data.get(DATA_HUB)) is None:
+        hub = hass.data[DATA_HUB] = KodiStreamDetailsHub(hass)
+    return hub
+
+
+class KodiStreamDetailsHub:
+    """Poll many Kodi players from one staggered schedule.
+
+    Members keep their own coordinator and entities but have no timer of
+    their own. The hub spreads their polls evenly over the poll interval
+    instead of firing them all at once, caps the RPCs in flight across
+    all members and records how long each player takes to poll.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        # Shared by the members' RPC calls
+        self.rpc_semaphore = asyncio.Semaphore(HUB_MAX_RPCS_IN_FLIGHT)
+        self._members: dict[str, KodiStreamDetailsCoordinator] = {}
+        # Loop time of each member's next poll
+        self._next_due: dict[str, float] = {}
+        self._polls: dict[str, asyncio.Task[None]] = {}
+        self._latency: dict[str, dict[str, Any]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return the schedule and per-player latency for diagnostics."""
+        now = self.hass.loop.time()
+        return {
+            "members": len(self._members),
+            "max_rpcs_in_flight": HUB_MAX_RPCS_IN_FLIGHT,
+            "polls_running": len(self._polls),
+            "players": {
+                source_entity_id: {
+                    **latency,
+                    "next_poll_in": round(
+                        max(self._next_due.get(source_entity_id, now) - now, 0.0), 3
+                    ),
+                }
+                for source_entity_id, latency in self._latency.items()
+            },
+        }
+
+    @callback
+    def async_register(self, coordinator: KodiStreamDetailsCoordinator) -> CALLBACK_TYPE:
+        """Add a player to the schedule, return a callback that removes it."""
+        source_entity_id = coordinator.source_entity_id
+        self._members[source_entity_id] = coordinator
+        self._latency[source_entity_id] = {
+            "polls": 0,
+            "last": None,
+            "average": None,
+            "max": None,
+        }
+        self._async_stagger()
+        self._async_schedule()
+        return partial(self._async_unregister, source_entity_id)
+
+    @callback
+    def _async_unregister(self, source_entity_id: str) -> None:
+        """Remove a player from the schedule."""
+        self._members.pop(source_entity_id, None)
+        self._next_due.pop(source_entity_id, None)
+        self._latency.pop(source_entity_id, None)
+        if (task := self._polls.pop(source_entity_id, None)) is not None:
+            task.cancel()
+        self._async_schedule()
+
+    @callback
+    def async_reschedule(self, coordinator: KodiStreamDetailsCoordinator) -> None:
+        """Bring a player's next poll forward after its interval shrank.
+
+        A running poll schedules the next one itself when it ends. A
+        longer interval takes effect from the next poll on.
+        """
+        source_entity_id = coordinator.source_entity_id
+        if (
+            self._members.get(source_entity_id) is not coordinator
+            or source_entity_id in self._polls
+        ):
+            return
+        due = self.hass.loop.time() + coordinator.effective_interval
+        if due < self._next_due.get(source_entity_id, due + 1):
+            self._next_due[source_entity_id] = due
+            self._async_schedule()
+
+    @callback
+    def _async_stagger(self) -> None:
+        """Spread the next poll of every member evenly over its interval."""
+        now = self.hass.loop.time()
+        members = sorted(self._members)
+        for index, source_entity_id in enumerate(members):
+            interval = self._members[source_entity_id].effective_interval
+            self._next_due[source_entity_id] = now + interval * (index + 1) / len(
+                members
+            )
+
+    @callback
+    def _async_schedule(self) -> None:
+        """Arm the timer for the earliest poll that is not running."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending = [
+            due
+            for source_entity_id, due in self._next_due.items()
+            if source_entity_id not in self._polls
+        ]
+        if pending:
+            self._timer = self.hass.loop.call_at(min(pending), self._async_on_timer)
+
+    @callback
+    def _async_on_timer(self) -> None:
+        """Start the polls that are due."""
+        self._timer = None
+        now = self.hass.loop.time()
+        for source_entity_id, due in self._next_due.items():
+            if due <= now and source_entity_id not in self._polls:
+                self._polls[source_entity_id] = self.hass.async_create_background_task(
+                    self._async_poll(source_entity_id),
+                    name=f"{DOMAIN} hub poll {source_entity_id}",
+                )
+        self._async_schedule()
+
+    async def _async_poll(self, source_entity_id: str) -> None:
+        """Refresh one player and schedule its next poll in the same slot."""
+        coordinator = self._members[source_entity_id]
+        start = self.hass.loop.time()
+        try:
+            await coordinator.async_refresh()
+        finally:
+            end = self.hass.loop.time()
+            if self._polls.get(source_entity_id) is asyncio.current_task():
+                del self._polls[source_entity_id]
+            if self._members.get(source_entity_id) is coordinator:
+                self._record_latency(source_entity_id, end - start)
+                # Keep the player's offset unless the poll overran its slot
+                interval = coordinator.effective_interval
+                due = self._next_due[source_entity_id] + interval
+                if due <= end:
+                    due = end + interval
+                self._next_due[source_entity_id] = due
+                self._async_schedule()
+
+    def _record_latency(self, source_entity_id: str, duration: float) -> None:
+        """Record how long a player took to poll."""
+        latency = self._latency[source_entity_id]
+        latency["polls"] += 1
+        latency["last"] = round(duration, 4)
+        latency["max"] = round(max(latency["max"] or 0.0, duration), 4)
+        if latency["average"] is None:
+            latency["average"] = round(duration, 4)
+        else:
+            latency["average"] = round(
+                latency["average"]
+                + HUB_LATENCY_SMOOTHING * (duration - latency["average"]),
+                4,
+            )
+        if duration > self._members[source_entity_id].effective_interval:
+            _LOGGER.debug(
+                "Polling %s took %.3fs, longer than its interval",
+                source_entity_id,
+                duration,
+            )
@@ -0,0 +1,194 @@
+"""Normalization of Kodi stream details for Kodi Stream Details.
+
+Only depends on the constants module. Importing it through the package
+runs the package __init__, which needs Home Assistant, but it can be
+loaded on its own as scripts/offline.py does. The lookup tables are built
+once at import and each normalizing function remembers the raw values it
+has seen, as a player reports the same few codecs and sizes poll after
+poll.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from typing import Any
+
+from .const import (
+    ASPECT_RATIO_NAMES,
+    ASPECT_RATIO_TOLERANCE,
+    AUDIO_CODEC_DISPLAY,
+    AUDIO_CODEC_MAP,
+    CHANNEL_LAYOUTS,
+    HDR_TYPE_DISPLAY,
+    HDR_TYPE_MAP,
+    LANGUAGE_NAMES,
+    NORMALIZE_CACHE_SIZE,
+    RESOLUTION_HEIGHT_THRESHOLDS,
+    RESOLUTION_THRESHOLDS,
+    VIDEO_CODEC_DISPLAY,
+    VIDEO_CODEC_MAP,
+)
+
+# Raw codec name to (normalized name, display name)
+VIDEO_CODECS: dict[str, tuple[str, str | None]] = {
+    raw: (codec, VIDEO_CODEC_DISPLAY.get(codec))
+    for raw, codec in VIDEO_CODEC_MAP.items()
+}
+AUDIO_CODECS: dict[str, tuple[str, str | None]] = {
+    raw: (codec, AUDIO_CODEC_DISPLAY.get(codec))
+    for raw, codec in AUDIO_CODEC_MAP.items()
+}
+
+# Raw HDR type to (normalized type, display name)
+HDR_TYPES: dict[str, tuple[str, str]] = {
+    raw: (hdr_type, HDR_TYPE_DISPLAY.get(hdr_type, "SDR"))
+    for raw, hdr_type in HDR_TYPE_MAP.items()
+}
+
+# Resolution labels from lowest to highest, with the width each one
+# starts at
+_RESOLUTIONS = [label for _, label in sorted(RESOLUTION_THRESHOLDS)]
+_WIDTHS = [width for width, _ in sorted(RESOLUTION_THRESHOLDS)]
+# Heights that reach a tier, lowest first, with the tier's position in
+# _RESOLUTIONS
+_HEIGHT_TIERS = sorted(
+    (height, _RESOLUTIONS.index(label))
+    for height, label in RESOLUTION_HEIGHT_THRESHOLDS
+)
+_HEIGHTS = [height for height, _ in _HEIGHT_TIERS]
+
+# Known aspect ratios in ascending order, with their position in
+# ASPECT_RATIO_NAMES, which wins when several are within the tolerance
+_ASPECTS = sorted(
+    (ratio, order, name)
+    for order, (ratio, name) in enumerate(ASPECT_RATIO_NAMES.items())
+)
+_ASPECT_RATIOS = [ratio for ratio, _, _ in _ASPECTS]
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def normalize_video_codec(codec: str) -> tuple[str | None, str | None]:
+    """Return the normalized and display name of a video codec."""
+    if not codec:
+        return None, None
+    codec_lower = codec.lower()
+    return VIDEO_CODECS.get(
+        codec_lower, (codec_lower, VIDEO_CODEC_DISPLAY.get(codec_lower))
+    )
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def normalize_audio_codec(codec: str) -> tuple[str | None, str | None]:
+    """Return the normalized and display name of an audio codec."""
+    if not codec:
+        return None, None
+    codec_lower = codec.lower()
+    # Handle PCM variants
+    if codec_lower.startswith("pcm"):
+        return AUDIO_CODECS["pcm"]
+    return AUDIO_CODECS.get(
+        codec_lower, (codec_lower, AUDIO_CODEC_DISPLAY.get(codec_lower))
+    )
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def normalize_hdr_type(hdr_type: str) -> tuple[str, str]:
+    """Return the normalized and display name of an HDR type."""
+    return HDR_TYPES.get(hdr_type, (hdr_type or "sdr", "SDR"))
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def derive_resolution(width: int, height: int = 0) -> str | None:
+    """Return the resolution label of a video.
+
+    The width decides. The height can raise the label to an HD tier for
+    encodes cropped at the sides, as long as the frame is at least 4:3,
+    but never lower it: scope films are short for their width.
+    """
+    if not width:
+        return None
+    index = bisect_right(_WIDTHS, width) - 1
+    if (tier := bisect_right(_HEIGHTS, height or 0)) and width * 3 >= height * 4:
+        index = max(index, _HEIGHT_TIERS[tier - 1][1])
+    return _RESOLUTIONS[max(index, 0)]
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def format_aspect(aspect: float) -> str | None:
+    """Format an aspect ratio to a human-readable string."""
+    if not aspect:
+        return None
+    # Known ratios within the tolerance, the first listed one wins
+    start = bisect_left(_ASPECT_RATIOS, aspect - ASPECT_RATIO_TOLERANCE)
+    end = bisect_right(_ASPECT_RATIOS, aspect + ASPECT_RATIO_TOLERANCE)
+    matches = [
+        (order, name)
+        for ratio, order, name in _ASPECTS[start:end]
+        if abs(aspect - ratio) < ASPECT_RATIO_TOLERANCE
+    ]
+    if matches:
+        return min(matches)[1]
+    # Format as X.XX:1
+    return f"{aspect:.2f}:1"
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def format_channels(channels: int) -> str | None:
+    """Format a channel count to standard notation."""
+    if not channels:
+        return None
+    return CHANNEL_LAYOUTS.get(channels) or f"{channels}.0"
+
+
+def annotate_audio_stream(stream: dict[str, Any]) -> dict[str, Any]:
+    """Return an audio track from Kodi with its normalized codec and language."""
+    codec, codec_display = normalize_audio_codec(stream.get("codec") or "")
+    return {
+        **stream,
+        "normalized_codec": codec,
+        "codec_display": codec_display,
+        "channel_layout": format_channels(stream.get("channels") or 0),
+        "language_name": LANGUAGE_NAMES.get(stream.get("language") or ""),
+    }
+
+
+def annotate_subtitle_stream(stream: dict[str, Any]) -> dict[str, Any]:
+    """Return a subtitle track from Kodi with its language name."""
+    return {
+        **stream,
+        "language_name": LANGUAGE_NAMES.get(stream.get("language") or ""),
+    }
+
+
+def summarize_audio_streams(streams: Iterable[Mapping[str, Any]]) -> str:
+    """Return one token per annotated audio track, such as eng truehd_atmos 7.1."""
+    return ", ".join(
+        " ".join(
+            token
+            for token in (
+                stream.get("language") or "und",
+                stream.get("normalized_codec"),
+                stream.get("channel_layout"),
+            )
+            if token
+        )
+        for stream in streams
+    )
+
+
+def summarize_subtitle_streams(streams: Iterable[Mapping[str, Any]]) -> str:
+    """Return one short token per subtitle track, such as eng forced."""
+    return ", ".join(
+        " ".join(
+            token
+            for token, flag in (
+                (stream.get("language") or "und", True),
+                ("forced", stream.get("isforced")),
+                ("sdh", stream.get("isimpaired")),
+            )
+            if flag
+        )
+        for stream in streams
+    )
@@ -0,0 +1,114 @@
+"""Built-in Kodi JSON-RPC client for Kodi Stream Details."""
+
+from __future__ import annotations
+
+import itertools
+import json
+from typing import Any
+
+import aiohttp
+
+from .const import RPC_TIMEOUT
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
+
+def _dumps(payload: Any) -> bytes:
+    """Encode a JSON-RPC request."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Decode a JSON-RPC response."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class KodiRpcError(Exception):
+    """Error reported by Kodi or the JSON-RPC transport."""
+
+
+class KodiJsonRpcClient:
+    """Lightweight JSON-RPC client talking to Kodi over HTTP.
+
+    Requests reuse the keep-alive connections of the aiohttp session, each
+    call has its own timeout and responses are decoded with orjson when it
+    is installed. Several calls can be pipelined into one JSON-RPC batch
+    request. call_method matches pykodi's Kodi.call_method, so the client
+    can be used in its place.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        host: str,
+        port: int,
+        username: str | None = None,
+        password: str | None = None,
+        ssl: bool = False,
+        timeout: float = RPC_TIMEOUT,
+    ) -> None:
+        """Initialize the client."""
+        self._session = session
+        self.url = f"{'https' if ssl else 'http'}://{host}:{port}/jsonrpc"
+        self._auth = aiohttp.BasicAuth(username, password or "") if username else None
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._ids = itertools.count(1)
+
+    async def call_method(self, method: str, **params: Any) -> Any:
+        """Call a Kodi method and return its result."""
+        request = self._request(method, params)
+        return self._result(await self._async_post(request))
+
+    async def call_batch(self, calls: list[tuple[str, dict[str, Any]]]) -> list[Any]:
+        """Call several Kodi methods in one request, return their results in order."""
+        requests = [self._request(method, params) for method, params in calls]
+        responses = await self._async_post(requests)
+        if not isinstance(responses, list):
+            # Kodi answers a malformed batch with a single error object
+            raise KodiRpcError(f"Kodi rejected the batch request: {responses}")
+        by_id = {response.get("id"): response for response in responses}
+        return [self._result(by_id.get(request["id"], {})) for request in requests]
+
+    def _request(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Build a JSON-RPC request."""
+        request: dict[str, Any] = {
+            "jsonrpc": "2.0",
+            "id": next(self._ids),
+            "method": method,
+        }
+        if params:
+            request["params"] = params
+        return request
+
+    async def _async_post(self, payload: Any) -> Any:
+        """Send a request or batch and return the decoded response."""
+        async with self._session.post(
+            self.url,
+            data=_dumps(payload),
+            headers={aiohttp.hdrs.CONTENT_TYPE: "application/json"},
+            auth=self._auth,
+            timeout=self._timeout,
+        ) as response:
+            if response.status != 200:
+                raise KodiRpcError(f"HTTP {response.status} from {self.url}")
+            body = await response.read()
+        try:
+            return _loads(body)
+        except ValueError as err:
+            raise KodiRpcError(f"Invalid JSON from Kodi: {err}") from err
+
+    @staticmethod
+    def _result(response: dict[str, Any]) -> Any:
+        """Return the result of a JSON-RPC response, raising on errors."""
+        if (error := response.get("error")) is not None:
+            raise KodiRpcError(f"{error.get('message')} ({error.get('code')})")
+        if "result" not in response:
+            raise KodiRpcError("Kodi returned no result")
+        return response["result"]
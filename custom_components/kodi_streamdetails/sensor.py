@@ -16,6 +16,24 @@ from .const import CONF_SOURCE_ENTITY, DOMAIN, SENSOR_TYPES
 from .coordinator import KodiStreamDetailsCoordinator
 
 
+def _sensor_data_keys(sensor_type: str) -> frozenset[str]:
+    """Return the coordinator data keys a sensor renders.
+
+    Used as the listener context so a sensor is only updated when one of
+    its keys changes.
+    """
+    config = SENSOR_TYPES.get(sensor_type, {})
+    return frozenset(
+        (
+            sensor_type,
+            config.get("value", sensor_type),
+            *config.get("attributes", {}).values(),
+            *config.get("always_attributes", {}).values(),
+            *config.get("attribute_maps", ()),
+        )
+    )
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -75,6 +93,9 @@ class KodiStreamDetailsSensor(CoordinatorEntity[KodiStreamDetailsCoordinator], S
     """Sensor for Kodi stream details."""
 
     _attr_has_entity_name = True
+    # Track lists are large and change with every item, only the summary
+    # is recorded
+    _unrecorded_attributes = frozenset({"streams"})
 
     def __init__(
         self,
@@ -84,7 +105,10 @@ class KodiStreamDetailsSensor(CoordinatorEntity[KodiStreamDetailsCoordinator], S
         source_entity_id: str,
     ) -> None:
         """Initialize sensor."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=_sensor_data_keys(sensor_type),
+        )
         self._sensor_type = sensor_type
         self._attr_device_info = device_info
         self._attr_unique_id = f"{source_entity_id}_{sensor_type}"
@@ -99,101 +123,12 @@ class KodiStreamDetailsSensor(CoordinatorEntity[KodiStreamDetailsCoordinator], S
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
-        if self.coordinator.data is None:
-            return ""
-
-        data = self.coordinator.data
-
-        # For certain sensors, show display name as state value
-        if self._sensor_type == "video_codec":
-            return data.get("video_codec_display") or ""
-        if self._sensor_type == "video_hdr_type":
-            return data.get("video_hdr_type_display") or ""
-        if self._sensor_type == "audio_codec":
-            return data.get("audio_codec_display") or ""
-
-        # Return empty string instead of None for blank display
-        value = data.get(self._sensor_type)
-        if value is None:
-            return ""
-        return value
+        return self.coordinator.sensor_state(self._sensor_type)[0]
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional attributes based on sensor type."""
-        if self.coordinator.data is None:
-            return None
-
-        data = self.coordinator.data
-        attrs: dict[str, Any] = {}
-
-        # Add relevant attributes based on sensor type
-        if self._sensor_type == "video_codec":
-            if data.get("video_codec_raw"):
-                attrs["raw_codec"] = data["video_codec_raw"]
-            if data.get("video_codec"):
-                attrs["normalized"] = data["video_codec"]
-
-        elif self._sensor_type == "video_resolution":
-            if data.get("video_width"):
-                attrs["width"] = data["video_width"]
-            if data.get("video_height"):
-                attrs["height"] = data["video_height"]
-
-        elif self._sensor_type == "video_aspect":
-            if data.get("video_aspect_raw"):
-                attrs["raw_aspect"] = data["video_aspect_raw"]
-
-        elif self._sensor_type == "video_hdr_type":
-            if data.get("video_hdr_type_raw"):
-                attrs["raw_hdrtype"] = data["video_hdr_type_raw"]
-            if data.get("video_hdr_type"):
-                attrs["normalized"] = data["video_hdr_type"]
-
-        elif self._sensor_type == "video_duration":
-            if data.get("video_duration_formatted"):
-                attrs["formatted"] = data["video_duration_formatted"]
-
-        elif self._sensor_type == "audio_codec":
-            if data.get("audio_codec_raw"):
-                attrs["raw_codec"] = data["audio_codec_raw"]
-            if data.get("audio_codec"):
-                attrs["normalized"] = data["audio_codec"]
-
-        elif self._sensor_type == "audio_channels":
-            if data.get("audio_channels_raw"):
-                attrs["raw_channels"] = data["audio_channels_raw"]
-
-        elif self._sensor_type == "audio_language":
-            if data.get("audio_language_name"):
-                attrs["language_name"] = data["audio_language_name"]
-
-        elif self._sensor_type == "audio_bitrate":
-            if data.get("audio_bitrate_formatted"):
-                attrs["formatted"] = data["audio_bitrate_formatted"]
-
-        elif self._sensor_type == "audio_stream_count":
-            if data.get("audio_streams"):
-                attrs["streams"] = data["audio_streams"]
-
-        elif self._sensor_type == "subtitle_language":
-            if data.get("subtitle_language_name"):
-                attrs["language_name"] = data["subtitle_language_name"]
-
-        elif self._sensor_type == "subtitle_stream_count":
-            if data.get("subtitle_streams"):
-                attrs["streams"] = data["subtitle_streams"]
-
-        elif self._sensor_type == "playback_type":
-            attrs["media_type"] = data.get("playback_type")
-
-        elif self._sensor_type == "artwork_count":
-            # Expose all artwork URLs as attributes
-            artwork = data.get("artwork", {})
-            for art_type, url in artwork.items():
-                attrs[art_type] = url
-
-        return attrs if attrs else None
+        return self.coordinator.sensor_state(self._sensor_type)[1]
 
     @property
     def available(self) -> bool:
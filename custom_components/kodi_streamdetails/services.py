@@ -0,0 +1,45 @@
+"""Services for Kodi Stream Details."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import DOMAIN, SERVICE_GET_STREAMS
+from .coordinator import KodiStreamDetailsCoordinator
+
+GET_STREAMS_SCHEMA = vol.Schema({vol.Required(ATTR_ENTITY_ID): cv.entity_id})
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Kodi Stream Details services."""
+
+    async def _async_get_streams(call: ServiceCall) -> ServiceResponse:
+        """Return the full audio and subtitle track lists of a Kodi player."""
+        entity_id = call.data[ATTR_ENTITY_ID]
+        coordinator: KodiStreamDetailsCoordinator
+        for coordinator in hass.data.get(DOMAIN, {}).values():
+            if coordinator.source_entity_id == entity_id:
+                return coordinator.stream_lists()
+        raise ServiceValidationError(
+            f"{entity_id} is not monitored by Kodi Stream Details"
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_STREAMS,
+        _async_get_streams,
+        schema=GET_STREAMS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,155 @@
+"""Stream details snapshot for Kodi Stream Details."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field, fields, replace
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class StreamSnapshot(Mapping[str, Any]):
+    """Stream details published by the coordinator after a poll.
+
+    Values live in slots rather than a dict built on every poll, and a
+    snapshot is never modified once published, so unchanged polls can be
+    detected by plain equality and nothing-playing polls share one empty
+    instance. The mapping interface keeps the data keys used by the
+    sensors, diagnostics and the stored snapshot.
+    """
+
+    # Video (from streamdetails)
+    video_codec: str | None = None
+    video_codec_raw: str | None = None
+    video_codec_display: str | None = None
+    video_width: int | None = None
+    video_height: int | None = None
+    video_resolution: str | None = None
+    video_aspect: str | None = None
+    video_aspect_raw: float | None = None
+    video_hdr_type: str | None = None
+    video_hdr_type_raw: str | None = None
+    video_hdr_type_display: str | None = None
+    video_stereo_mode: str | None = None
+    video_duration: int | None = None
+    video_duration_formatted: str | None = None
+    # Audio (from Player.GetProperties)
+    audio_codec: str | None = None
+    audio_codec_raw: str | None = None
+    audio_codec_display: str | None = None
+    audio_channels: str | None = None
+    audio_channels_raw: int | None = None
+    audio_language: str | None = None
+    audio_language_name: str | None = None
+    audio_name: str | None = None
+    audio_bitrate: int | None = None
+    audio_bitrate_formatted: str | None = None
+    audio_stream_index: int | None = None
+    audio_stream_count: int = 0
+    audio_streams: tuple[Mapping[str, Any], ...] = ()
+    audio_streams_summary: str | None = None
+    audio_is_default: str = "off"
+    audio_is_original: str = "off"
+    # Subtitles (from Player.GetProperties)
+    subtitle_enabled: str = "off"
+    subtitle_language: str | None = "off"
+    subtitle_language_name: str | None = None
+    subtitle_name: str | None = None
+    subtitle_stream_index: int | None = None
+    subtitle_stream_count: int = 0
+    subtitle_streams: tuple[Mapping[str, Any], ...] = ()
+    subtitle_streams_summary: str | None = None
+    subtitle_is_forced: str = "off"
+    subtitle_is_impaired: str = "off"
+    # Playback
+    playback_type: str = ""
+    # Artwork
+    artwork: dict[str, str] = field(default_factory=dict)
+    artwork_variants: dict[str, str] = field(default_factory=dict)
+    artwork_count: int = 0
+
+    # Hashing would fail on the stream lists, compare snapshots instead
+    __hash__ = None  # type: ignore[assignment]
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> StreamSnapshot:
+        """Build a snapshot from stored data, ignoring unknown keys."""
+        values = {key: data[key] for key in SNAPSHOT_KEYS if key in data}
+        # Stream lists are stored as JSON arrays
+        for key in ("audio_streams", "subtitle_streams"):
+            if key in values:
+                values[key] = tuple(values[key] or ())
+        return cls(**values)
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value of a data key."""
+        if key not in _SNAPSHOT_KEY_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value of a data key, or the default for unknown keys."""
+        if key in _SNAPSHOT_KEY_SET:
+            return getattr(self, key)
+        return default
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the data keys."""
+        return iter(SNAPSHOT_KEYS)
+
+    def __len__(self) -> int:
+        """Return the number of data keys."""
+        return len(SNAPSHOT_KEYS)
+
+    def changed_keys(self, other: StreamSnapshot) -> set[str]:
+        """Return the data keys whose value differs from another snapshot."""
+        if other is self:
+            return set()
+        return {
+            key for key in SNAPSHOT_KEYS if getattr(self, key) != getattr(other, key)
+        }
+
+    def with_artwork(
+        self, artwork: dict[str, str], artwork_variants: dict[str, str]
+    ) -> StreamSnapshot:
+        """Return a copy of the snapshot with new artwork URLs."""
+        return replace(
+            self,
+            artwork=artwork,
+            artwork_variants=artwork_variants,
+            artwork_count=len(artwork),
+        )
+
+
+SNAPSHOT_KEYS: tuple[str, ...] = tuple(item.name for item in fields(StreamSnapshot))
+_SNAPSHOT_KEY_SET = frozenset(SNAPSHOT_KEYS)
+
+# Published while nothing is playing
+EMPTY_SNAPSHOT = StreamSnapshot()
+
+
+def build_sensor_state(
+    sensor_type: str,
+    config: Mapping[str, Any],
+    data: StreamSnapshot,
+    stream_limit: int,
+) -> tuple[Any, dict[str, Any] | None]:
+    """Build the state and attributes of a sensor from its SENSOR_TYPES entry."""
+    get = data.get
+    value = get(config.get("value", sensor_type))
+    attrs: dict[str, Any] = {}
+    for name, key in config.get("attributes", {}).items():
+        if attr := get(key):
+            attrs[name] = attr
+    for name, key in config.get("always_attributes", {}).items():
+        attrs[name] = get(key)
+    for key in config.get("attribute_maps", ()):
+        attrs.update(get(key) or {})
+    # Track lists are capped, the get_streams service returns them in full
+    if "streams" in attrs:
+        if stream_limit:
+            attrs["streams"] = attrs["streams"][:stream_limit]
+        else:
+            del attrs["streams"]
+    # Empty string instead of None for a blank state
+    return ("" if value is None else value), (attrs or None)
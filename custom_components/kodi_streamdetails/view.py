@@ -0,0 +1,51 @@
+"""HTTP view serving cached artwork for Kodi Stream Details."""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import HomeAssistantView
+
+if TYPE_CHECKING:
+    from .artwork import ArtworkCache
+
+# Artwork is addressed by content hash, so a URL never changes content
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class ArtworkView(HomeAssistantView):
+    """Serve cached artwork by content hash.
+
+    This is the only way the cache is served. Like the /local files it
+    replaced, artwork is served without authentication so dashboards and
+    companion apps can load it directly; URLs are unguessable content
+    hashes.
+    """
+
+    url = "/api/kodi_streamdetails/artwork/{digest}"
+    name = "api:kodi_streamdetails:artwork"
+    requires_auth = False
+
+    def __init__(self, cache: ArtworkCache) -> None:
+        """Initialize the view."""
+        self._cache = cache
+
+    async def get(self, request: web.Request, digest: str) -> web.StreamResponse:
+        """Return an artwork image, or 304 if the client already has it."""
+        if (resolved := self._cache.async_resolve(digest)) is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+
+        path, content_type = resolved
+        # Streamed from disk instead of read into memory. aiohttp sets its
+        # own ETag from the file's mtime and size, replacing any other, and
+        # answers If-None-Match and Range requests for it
+        return web.FileResponse(
+            path,
+            headers={
+                hdrs.CACHE_CONTROL: CACHE_CONTROL,
+                hdrs.CONTENT_TYPE: content_type,
+            },
+        )
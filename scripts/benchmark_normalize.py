@@ -0,0 +1,129 @@
+"""Check and benchmark the stream normalization against the old loops.
+
+Runs without Home Assistant:
+
+    python scripts/benchmark_normalize.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import timeit
+
+from offline import import_module
+
+const = import_module("const")
+normalize = import_module("normalize")
+
+# Expected labels, including side-cropped encodes the old width-only loop
+# labelled a tier lower
+RESOLUTIONS = {
+    (3840, 2160): "4K",
+    (2880, 2160): "4K",
+    (3836, 1600): "1080p",
+    (1920, 800): "1080p",
+    (1440, 1080): "1080p",
+    (1400, 1080): "720p",
+    (960, 720): "720p",
+    (1280, 536): "720p",
+    (500, 1080): "SD",
+    (1, 2160): "SD",
+    (720, 576): "480p",
+    (720, 480): "480p",
+    (704, 480): "SD",
+    (640, 480): "SD",
+    (480, 360): "SD",
+}
+
+
+def old_derive_resolution(width: int) -> str | None:
+    """Derive the resolution label the way the coordinator used to."""
+    if not width:
+        return None
+    for threshold, label in const.RESOLUTION_THRESHOLDS:
+        if width >= threshold:
+            return label
+    return "SD"
+
+
+def old_format_aspect(aspect: float) -> str | None:
+    """Format an aspect ratio the way the coordinator used to."""
+    if not aspect:
+        return None
+    for known_aspect, name in const.ASPECT_RATIO_NAMES.items():
+        if abs(aspect - known_aspect) < 0.05:
+            return name
+    return f"{aspect:.2f}:1"
+
+
+def old_format_channels(channels: int) -> str | None:
+    """Format a channel count the way the coordinator used to."""
+    if not channels:
+        return None
+    channel_map = {1: "1.0", 2: "2.0", 3: "2.1", 6: "5.1", 7: "6.1", 8: "7.1"}
+    return channel_map.get(channels, f"{channels}.0")
+
+
+def check() -> None:
+    """Fail if normalization gives a different label than expected."""
+    for (width, height), expected in RESOLUTIONS.items():
+        label = normalize.derive_resolution(width, height)
+        if label != expected:
+            raise SystemExit(f"{width}x{height}: {label} != {expected}")
+    for width in range(1, 5000):
+        if normalize.derive_resolution(width) != old_derive_resolution(width):
+            raise SystemExit(f"width {width} changed label")
+    # Full frames and scope crops keep the label of the old loop
+    for width, _ in const.RESOLUTION_THRESHOLDS:
+        for height in (width * 9 // 16, width * 10 // 24):
+            if normalize.derive_resolution(width, height) != old_derive_resolution(
+                width
+            ):
+                raise SystemExit(f"{width}x{height} changed label")
+    rng = random.Random(0)
+    for aspect in [rng.uniform(0.5, 3.0) for _ in range(20000)]:
+        aspect = round(aspect, rng.choice((2, 3, 6)))
+        if normalize.format_aspect(aspect) != old_format_aspect(aspect):
+            raise SystemExit(f"aspect {aspect} changed label")
+    for channels in range(10):
+        if normalize.format_channels(channels) != old_format_channels(channels):
+            raise SystemExit(f"{channels} channels changed layout")
+
+
+def main() -> None:
+    """Run the checks and the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=100000)
+    args = parser.parse_args()
+
+    check()
+    print("checks passed")
+    calls = {
+        "resolution": (
+            lambda: old_derive_resolution(1920),
+            lambda: normalize.derive_resolution.__wrapped__(1920, 800),
+            lambda: normalize.derive_resolution(1920, 800),
+        ),
+        "aspect": (
+            lambda: old_format_aspect(2.4),
+            lambda: normalize.format_aspect.__wrapped__(2.4),
+            lambda: normalize.format_aspect(2.4),
+        ),
+        "channels": (
+            lambda: old_format_channels(8),
+            lambda: normalize.format_channels.__wrapped__(8),
+            lambda: normalize.format_channels(8),
+        ),
+    }
+    print(f"{'':<12}{'old loop':>12}{'uncached':>12}{'cached':>12}  (ns/call)")
+    for name, funcs in calls.items():
+        timings = [
+            min(timeit.repeat(func, number=args.number, repeat=5)) / args.number * 1e9
+            for func in funcs
+        ]
+        print(f"{name:<12}" + "".join(f"{timing:12.0f}" for timing in timings))
+
+
+if __name__ == "__main__":
+    main()
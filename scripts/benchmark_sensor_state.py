@@ -0,0 +1,245 @@
+"""Benchmark building sensor states from SENSOR_TYPES against the old chain.
+
+Runs without Home Assistant:
+
+    python scripts/benchmark_sensor_state.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from types import SimpleNamespace
+from collections.abc import Mapping
+from typing import Any
+
+from offline import import_module
+
+const = import_module("const")
+snapshot = import_module("snapshot")
+
+SENSOR_TYPES = const.SENSOR_TYPES
+DEFAULT_STREAM_ATTRIBUTE_LIMIT = const.DEFAULT_STREAM_ATTRIBUTE_LIMIT
+StreamSnapshot = snapshot.StreamSnapshot
+build_sensor_state = snapshot.build_sensor_state
+
+AUDIO_STREAMS = tuple(
+    {
+        "index": index,
+        "codec": "truehd",
+        "channels": 8,
+        "language": "eng",
+        "name": f"Track {index}",
+    }
+    for index in range(4)
+)
+SUBTITLE_STREAMS = tuple(
+    {"index": index, "language": "eng", "name": f"Subtitle {index}"}
+    for index in range(6)
+)
+
+DATA = StreamSnapshot(
+    video_codec="hevc",
+    video_codec_raw="hevc",
+    video_codec_display="HEVC",
+    video_width=3840,
+    video_height=1600,
+    video_resolution="4K",
+    video_aspect="2.39:1",
+    video_aspect_raw=2.4,
+    video_hdr_type="dolbyvision",
+    video_hdr_type_raw="dolbyvision",
+    video_hdr_type_display="Dolby Vision",
+    video_duration=8160,
+    video_duration_formatted="2:16:00",
+    audio_codec="truehd",
+    audio_codec_raw="truehd",
+    audio_codec_display="Dolby TrueHD",
+    audio_channels="7.1",
+    audio_channels_raw=8,
+    audio_language="eng",
+    audio_language_name="English",
+    audio_bitrate=4500000,
+    audio_bitrate_formatted="4.5 Mbps",
+    audio_stream_count=len(AUDIO_STREAMS),
+    audio_streams=AUDIO_STREAMS,
+    subtitle_enabled="on",
+    subtitle_language="eng",
+    subtitle_language_name="English",
+    subtitle_stream_count=len(SUBTITLE_STREAMS),
+    subtitle_streams=SUBTITLE_STREAMS,
+    playback_type="movie",
+    artwork={"poster": "/api/kodi_streamdetails/artwork/poster"},
+    # No resized variants, the old chain predates them
+    artwork_count=1,
+)
+
+
+class ChainSensor:
+    """Sensor rendering before SENSOR_TYPES declared it.
+
+    The two properties are copied verbatim from the baseline sensor.py.
+    """
+
+    def __init__(self, sensor_type: str, data: Mapping[str, Any]) -> None:
+        """Initialize the sensor."""
+        self.coordinator = SimpleNamespace(data=data)
+        self._sensor_type = sensor_type
+
+    @property
+    def native_value(self) -> Any:
+        """Return the state of the sensor."""
+        if self.coordinator.data is None:
+            return ""
+
+        data = self.coordinator.data
+
+        # For certain sensors, show display name as state value
+        if self._sensor_type == "video_codec":
+            return data.get("video_codec_display") or ""
+        if self._sensor_type == "video_hdr_type":
+            return data.get("video_hdr_type_display") or ""
+        if self._sensor_type == "audio_codec":
+            return data.get("audio_codec_display") or ""
+
+        # Return empty string instead of None for blank display
+        value = data.get(self._sensor_type)
+        if value is None:
+            return ""
+        return value
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return additional attributes based on sensor type."""
+        if self.coordinator.data is None:
+            return None
+
+        data = self.coordinator.data
+        attrs: dict[str, Any] = {}
+
+        # Add relevant attributes based on sensor type
+        if self._sensor_type == "video_codec":
+            if data.get("video_codec_raw"):
+                attrs["raw_codec"] = data["video_codec_raw"]
+            if data.get("video_codec"):
+                attrs["normalized"] = data["video_codec"]
+
+        elif self._sensor_type == "video_resolution":
+            if data.get("video_width"):
+                attrs["width"] = data["video_width"]
+            if data.get("video_height"):
+                attrs["height"] = data["video_height"]
+
+        elif self._sensor_type == "video_aspect":
+            if data.get("video_aspect_raw"):
+                attrs["raw_aspect"] = data["video_aspect_raw"]
+
+        elif self._sensor_type == "video_hdr_type":
+            if data.get("video_hdr_type_raw"):
+                attrs["raw_hdrtype"] = data["video_hdr_type_raw"]
+            if data.get("video_hdr_type"):
+                attrs["normalized"] = data["video_hdr_type"]
+
+        elif self._sensor_type == "video_duration":
+            if data.get("video_duration_formatted"):
+                attrs["formatted"] = data["video_duration_formatted"]
+
+        elif self._sensor_type == "audio_codec":
+            if data.get("audio_codec_raw"):
+                attrs["raw_codec"] = data["audio_codec_raw"]
+            if data.get("audio_codec"):
+                attrs["normalized"] = data["audio_codec"]
+
+        elif self._sensor_type == "audio_channels":
+            if data.get("audio_channels_raw"):
+                attrs["raw_channels"] = data["audio_channels_raw"]
+
+        elif self._sensor_type == "audio_language":
+            if data.get("audio_language_name"):
+                attrs["language_name"] = data["audio_language_name"]
+
+        elif self._sensor_type == "audio_bitrate":
+            if data.get("audio_bitrate_formatted"):
+                attrs["formatted"] = data["audio_bitrate_formatted"]
+
+        elif self._sensor_type == "audio_stream_count":
+            if data.get("audio_streams"):
+                attrs["streams"] = data["audio_streams"]
+
+        elif self._sensor_type == "subtitle_language":
+            if data.get("subtitle_language_name"):
+                attrs["language_name"] = data["subtitle_language_name"]
+
+        elif self._sensor_type == "subtitle_stream_count":
+            if data.get("subtitle_streams"):
+                attrs["streams"] = data["subtitle_streams"]
+
+        elif self._sensor_type == "playback_type":
+            attrs["media_type"] = data.get("playback_type")
+
+        elif self._sensor_type == "artwork_count":
+            # Expose all artwork URLs as attributes
+            artwork = data.get("artwork", {})
+            for art_type, url in artwork.items():
+                attrs[art_type] = url
+
+        return attrs if attrs else None
+
+
+CHAIN_SENSORS = [ChainSensor(sensor_type, DATA) for sensor_type in SENSOR_TYPES]
+
+
+def run_chain() -> None:
+    """Render every sensor with the old chain, once per state write."""
+    for sensor in CHAIN_SENSORS:
+        sensor.native_value
+        sensor.extra_state_attributes
+
+
+def run_table() -> None:
+    """Render every sensor from its SENSOR_TYPES entry."""
+    for sensor_type, config in SENSOR_TYPES.items():
+        build_sensor_state(sensor_type, config, DATA, DEFAULT_STREAM_ATTRIBUTE_LIMIT)
+
+
+def run_cached(states: dict[str, tuple[Any, dict[str, Any] | None]]) -> None:
+    """Read every sensor from the states the coordinator built for the snapshot."""
+    for sensor_type in SENSOR_TYPES:
+        states[sensor_type]
+
+
+def check() -> None:
+    """Fail if the table renders a sensor differently from the old chain."""
+    for sensor, (sensor_type, config) in zip(CHAIN_SENSORS, SENSOR_TYPES.items()):
+        value, attrs = build_sensor_state(sensor_type, config, DATA, 100)
+        expected = (sensor.native_value, sensor.extra_state_attributes)
+        if (value, attrs) != expected:
+            raise SystemExit(f"{sensor_type}: {(value, attrs)!r} != {expected!r}")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    check()
+    states = {
+        sensor_type: build_sensor_state(
+            sensor_type, config, DATA, DEFAULT_STREAM_ATTRIBUTE_LIMIT
+        )
+        for sensor_type, config in SENSOR_TYPES.items()
+    }
+    for name, func in (
+        ("if/elif chain", run_chain),
+        ("SENSOR_TYPES table", run_table),
+        ("cached per snapshot", lambda: run_cached(states)),
+    ):
+        best = min(timeit.repeat(func, number=args.number, repeat=5))
+        print(
+            f"{name:<20} {best / args.number / len(SENSOR_TYPES) * 1e9:8.0f} ns/sensor"
+        )
+
+
+if __name__ == "__main__":
+    main()
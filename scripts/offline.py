@@ -0,0 +1,31 @@
+"""Import the Home Assistant free modules of the integration on their own.
+
+Importing a submodule normally runs the package __init__, which needs
+Home Assistant. Registering empty packages first skips it, so const,
+normalize and snapshot can be loaded in a plain Python environment.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from pathlib import Path
+from types import ModuleType
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "custom_components.kodi_streamdetails"
+
+
+def import_module(name: str) -> ModuleType:
+    """Import a submodule of the integration without its package __init__."""
+    path = ROOT
+    parts = PACKAGE.split(".")
+    for index, part in enumerate(parts):
+        path = path / part
+        package = ".".join(parts[: index + 1])
+        if package not in sys.modules:
+            module = types.ModuleType(package)
+            module.__path__ = [str(path)]
+            sys.modules[package] = module
+    return importlib.import_module(f"{PACKAGE}.{name}")